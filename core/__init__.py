@@ -9,8 +9,11 @@ This module provides:
 - Deep work session management
 """
 
+import importlib
+
 # Configuration
 from .config import (
+    IS_WINDOWS,
     WEBSITES_TO_BLOCK,
     APP_PATHS,
     HOSTS_FILE_PATH,
@@ -22,39 +25,60 @@ from .config import (
 )
 
 # Prompts
-from .prompts import PRODUCTIVITY_PROMPT_TEMPLATE
+from .prompts import build_prompt
 
 # Utilities
 from .utils import is_admin, run_as_admin, flush_dns, prompt_confirmation
 
 # Blocking
 from .hosts import modify_hosts
-from .processes import kill_target_processes
 
-# Capture and LLM
-from .capture_describer import SCREENSHOT_MODEL
-from .llm_api import is_local_model
+# Templates
+from .templates import FRONTEND_HTML
 
-# Monitoring
-from .monitoring import (
-    capture_all_stitched,
-    parse_productivity_response,
-    analyze_captures,
-    speak_result,
-    save_analysis,
-)
+# Everything below pulls in cv2, mss, numpy, PIL or the OpenAI client, so it is
+# imported on first access; the CLI can then fail its platform/admin checks fast
+_LAZY_ATTRS = {
+    # Prompts (read from its resource file on first use)
+    "PRODUCTIVITY_PROMPT_TEMPLATE": "prompts",
+    # Blocking
+    "kill_target_processes": "processes",
+    # Capture and LLM
+    "SCREENSHOT_MODEL": "capture_describer",
+    "is_local_model": "llm_api",
+    # Monitoring
+    "capture_frames": "monitoring",
+    "capture_all_stitched": "monitoring",
+    "parse_productivity_response": "monitoring",
+    "analyze_captures": "monitoring",
+    "speak_result": "monitoring",
+    "save_analysis": "monitoring",
+    # Save results
+    "save_image": "save_results",
+    "save_text": "save_results",
+    "get_timestamp": "save_results",
+    # Deep work session management
+    "DeepWorkWithMonitoring": "deepwork",
+}
 
-# Save results
-from .save_results import save_image, save_text, get_timestamp
 
-# Deep work session management
-from .deepwork import DeepWorkWithMonitoring
+def __getattr__(name: str):
+    """Import a heavy submodule the first time one of its exports is used."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Templates
-from .templates import FRONTEND_HTML
 
 __all__ = [
     # Config
+    "IS_WINDOWS",
     "WEBSITES_TO_BLOCK",
     "APP_PATHS",
     "HOSTS_FILE_PATH",
@@ -65,6 +89,7 @@ __all__ = [
     "CAPTURES_BEFORE_ANALYSIS",
     # Prompts
     "PRODUCTIVITY_PROMPT_TEMPLATE",
+    "build_prompt",
     # Utils
     "is_admin",
     "run_as_admin",
@@ -77,6 +102,7 @@ __all__ = [
     "SCREENSHOT_MODEL",
     "is_local_model",
     # Monitoring
+    "capture_frames",
     "capture_all_stitched",
     "parse_productivity_response",
     "analyze_captures",
@@ -11,13 +11,24 @@ Usage:
     For local Gemma 3 model, set SCREENSHOT_MODEL=gemma3:4b
 """
 
+import asyncio
+import atexit
+import functools
+import glob
 import io
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import mss
 import cv2
+import numpy as np
+from mss.base import MSSBase
 from PIL import Image
 
-from .llm_api import complete_vision, is_local_model
+from .llm_api import complete_vision, complete_vision_async, is_local_model
 from .save_results import save_screenshot_with_analysis, save_image, save_text, get_timestamp
 
 # Screenshot-specific model
@@ -27,18 +38,234 @@ SCREENSHOT_MODEL = os.environ.get("SCREENSHOT_MODEL", "gpt-5-nano")
 # Send images separately instead of stitched together
 SEND_IMAGES_SEPARATELY = os.environ.get("SEND_IMAGES_SEPARATELY", "false").lower() == "true"
 
+# Encoding for captured images: "JPEG" (smaller, faster) or "PNG" (lossless)
+IMAGE_FORMAT = os.environ.get("SCREENSHOT_FORMAT", "JPEG").upper()
+JPEG_QUALITY = 85
+
+# Longest side (px) of images sent to the vision model; 0 disables downscaling
+MAX_SIDE = int(os.environ.get("SCREENSHOT_MAX_SIDE", "1536"))
+
+# Use slow high-quality Lanczos resampling when scaling images for stitching
+HQ_SCALE = os.environ.get("HQ_SCALE", "false").lower() == "true"
+
+# How long detected device counts are trusted before probing again
+DEVICE_PROBE_TTL_SECONDS = 300
+
+# Longest side (px) of the webcam thumbnail in multi-capture stitches; 0 keeps full size.
+# The model only needs to tell whether someone is at the desk
+WEBCAM_MAX_SIDE = int(os.environ.get("WEBCAM_MAX_SIDE", "320"))
+
+# Probe all 10 webcam indices instead of stopping after the first 4
+PROBE_ALL_CAMS = os.environ.get("PROBE_ALL_CAMS", "0") == "1"
+
+# Screen capture backend: "mss" (portable) or "dxcam" (DXGI Desktop Duplication, Windows only)
+# Defaults to dxcam on Windows when it is installed
+SCREENSHOT_BACKEND = os.environ.get(
+    "SCREENSHOT_BACKEND", "dxcam" if sys.platform == "win32" else "mss"
+).lower()
+
+# libjpeg-turbo SIMD encoder; falls back to Pillow/OpenCV when not installed
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+dxcam = None
+if SCREENSHOT_BACKEND == "dxcam" and sys.platform == "win32":
+    try:
+        import dxcam
+    except ImportError:
+        if "SCREENSHOT_BACKEND" in os.environ:
+            print("dxcam not installed, falling back to mss")
+
+# Per-thread mss instances (mss handles are not safe to share across threads)
+_tls = threading.local()
+
+# Bumped when the monitor layout changes so threads refresh their mss instance
+_monitor_generation = 0
+_last_monitors: list[dict] = []
+
+# Long-lived capture pool so per-thread mss instances survive between captures
+_capture_pool: ThreadPoolExecutor | None = None
+_capture_pool_size = 0
+_capture_pool_lock = threading.Lock()
+
+# Open webcam handles, kept across captures since opening a camera is slow
+_webcams: dict[int, cv2.VideoCapture] = {}
+_webcams_lock = threading.Lock()
+
+# DXGI cameras per monitor with a lock each, plus the last encoded frame so an
+# unchanged desktop (grab() returns None) skips the encode entirely
+_dxcams: dict[int, tuple["dxcam.DXCamera", threading.Lock]] = {}
+_dxcam_last: dict[tuple[int, int], bytes] = {}
+_dxcam_lock = threading.Lock()
+
+
+def _ttl_cache(seconds: float):
+    """Cache a zero-argument function's result for the given number of seconds."""
+    def decorator(func):
+        lock = threading.Lock()
+        cache = {}
+
+        @functools.wraps(func)
+        def wrapper():
+            with lock:
+                now = time.monotonic()
+                if "value" not in cache or now >= cache["expires"]:
+                    cache["value"] = func()
+                    cache["expires"] = now + seconds
+                return cache["value"]
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _sct() -> MSSBase:
+    """Get this thread's mss instance, creating it on first use."""
+    sct = getattr(_tls, "sct", None)
+    if sct is None or _tls.generation != _monitor_generation:
+        if sct is not None:
+            sct.close()
+        sct = _tls.sct = mss.mss()
+        _tls.monitors = sct.monitors
+        _tls.generation = _monitor_generation
+    return sct
+
+
+def _monitors() -> list[dict]:
+    """Get the cached monitor list for this thread's mss instance."""
+    _sct()
+    return _tls.monitors
+
+
+def _get_capture_pool(workers: int) -> ThreadPoolExecutor:
+    """Get the shared capture pool, growing it if more workers are needed."""
+    global _capture_pool, _capture_pool_size
+    with _capture_pool_lock:
+        if _capture_pool is None or _capture_pool_size < workers:
+            if _capture_pool is not None:
+                _capture_pool.shutdown(wait=False)
+            _capture_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="capture")
+            _capture_pool_size = workers
+        return _capture_pool
+
+
+def encode_image(img: Image.Image) -> bytes:
+    """Encode a PIL image to bytes in the configured IMAGE_FORMAT."""
+    buffer = io.BytesIO()
+    if IMAGE_FORMAT == "JPEG":
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        if simplejpeg is not None:
+            return simplejpeg.encode_jpeg(np.asarray(img), quality=JPEG_QUALITY, colorspace="RGB")
+        img.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+    elif IMAGE_FORMAT == "PNG":
+        # Fastest zlib level: slightly larger files for a much cheaper encode
+        img.save(buffer, format="PNG", optimize=False, compress_level=1)
+    else:
+        img.save(buffer, format=IMAGE_FORMAT)
+    return buffer.getvalue()
+
 
+def encode_bgr(frame: np.ndarray) -> bytes:
+    """Encode a BGR(A) numpy frame to bytes in the configured IMAGE_FORMAT."""
+    if IMAGE_FORMAT == "JPEG" and simplejpeg is not None and frame.ndim == 3 and frame.shape[2] in (3, 4):
+        colorspace = "BGR" if frame.shape[2] == 3 else "BGRA"
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(frame), quality=JPEG_QUALITY, colorspace=colorspace
+        )
+    if IMAGE_FORMAT == "JPEG":
+        params = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+        ok, buf = cv2.imencode(".jpg", frame, params)
+    elif IMAGE_FORMAT == "PNG":
+        ok, buf = cv2.imencode(".png", frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    else:
+        ok, buf = cv2.imencode(f".{IMAGE_FORMAT.lower()}", frame)
+    if not ok:
+        raise RuntimeError(f"Failed to encode frame as {IMAGE_FORMAT}")
+    return buf.tobytes()
+
+
+def downscale_image(image_bytes: bytes, max_side: int | None = None) -> bytes:
+    """
+    Shrink an encoded image so its longest side is at most max_side pixels.
+
+    Vision models resize large inputs themselves, so sending full-resolution
+    captures only costs encode, upload and decode time.
+
+    Args:
+        image_bytes: Encoded image bytes
+        max_side: Longest side in pixels (defaults to MAX_SIDE, 0 disables)
+
+    Returns:
+        Re-encoded image bytes, or the input unchanged if already small enough
+    """
+    max_side = MAX_SIDE if max_side is None else max_side
+    if max_side <= 0:
+        return image_bytes
+
+    img = Image.open(io.BytesIO(image_bytes))
+    if max(img.size) <= max_side:
+        return image_bytes
+
+    img.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
+    return encode_image(img)
+
+
+@_ttl_cache(DEVICE_PROBE_TTL_SECONDS)
 def get_monitor_count() -> int:
-    """Get the number of available monitors."""
+    """Get the number of available monitors (cached for DEVICE_PROBE_TTL_SECONDS)."""
+    global _monitor_generation, _last_monitors
     with mss.mss() as sct:
-        # monitors[0] is all combined, monitors[1:] are individual monitors
-        return len(sct.monitors) - 1
+        monitors = sct.monitors
+
+    # Make capture threads pick up added/removed monitors
+    if monitors != _last_monitors:
+        _last_monitors = monitors
+        _monitor_generation += 1
 
+    # monitors[0] is all combined, monitors[1:] are individual monitors
+    return len(monitors) - 1
 
+
+def _enumerate_webcams() -> int | None:
+    """Count webcams via the OS device list, or None if not available."""
+    if sys.platform.startswith("linux"):
+        # UVC cameras also expose metadata nodes; only index 0 of each device captures
+        count = 0
+        for index_file in glob.glob("/sys/class/video4linux/video*/index"):
+            try:
+                with open(index_file) as f:
+                    count += f.read().strip() == "0"
+            except OSError:
+                continue
+        return count
+    if sys.platform == "win32":
+        try:
+            from pygrabber.dshow_graph import FilterGraph
+        except ImportError:
+            return None
+        return len(FilterGraph().get_input_devices())
+    return None
+
+
+@_ttl_cache(DEVICE_PROBE_TTL_SECONDS)
 def get_webcam_count() -> int:
-    """Get the number of available webcams."""
+    """Get the number of available webcams (cached for DEVICE_PROBE_TTL_SECONDS)."""
+    count = _enumerate_webcams()
+    if count is not None:
+        return count
+
+    # Fall back to opening each index; every open is a slow device enumeration
+    max_index = 10 if PROBE_ALL_CAMS else 4
     count = 0
-    for i in range(10):  # Check up to 10 potential webcam indices
+    for i in range(max_index):
+        with _webcams_lock:
+            if i in _webcams:
+                # Already open for capturing; reopening may fail on DirectShow
+                count += 1
+                continue
         cap = cv2.VideoCapture(i)
         if cap.isOpened():
             count += 1
@@ -48,41 +275,61 @@ def get_webcam_count() -> int:
     return count
 
 
-def capture_webcam(camera_index: int = 0) -> bytes:
+def _open_webcam(camera_index: int) -> cv2.VideoCapture:
+    """Open a webcam with a one-frame buffer so reads are never stale."""
+    if sys.platform == "win32":
+        cap = cv2.VideoCapture(camera_index, cv2.CAP_DSHOW)
+    else:
+        cap = cv2.VideoCapture(camera_index)
+    if cap.isOpened():
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    return cap
+
+
+@atexit.register
+def release_webcams():
+    """Release all cached webcam handles (turns the camera off)."""
+    with _webcams_lock:
+        for cap in _webcams.values():
+            cap.release()
+        _webcams.clear()
+
+
+def capture_webcam(camera_index: int = 0, max_side: int = 0) -> bytes:
     """
     Capture a photo from the webcam.
 
     Args:
         camera_index: Camera index (0 = default/primary webcam)
+        max_side: Longest side in pixels, shrunk with INTER_AREA (0 = native resolution)
 
     Returns:
-        PNG image bytes
+        Image bytes in IMAGE_FORMAT
 
     Raises:
         RuntimeError: If webcam cannot be opened or frame cannot be captured
     """
-    cap = cv2.VideoCapture(camera_index)
-    if not cap.isOpened():
-        raise RuntimeError(f"Could not open webcam at index {camera_index}")
-
-    try:
-        # Capture a frame
-        ret, frame = cap.read()
+    with _webcams_lock:
+        cap = _webcams.get(camera_index)
+        if cap is None:
+            cap = _open_webcam(camera_index)
+            if not cap.isOpened():
+                cap.release()
+                raise RuntimeError(f"Could not open webcam at index {camera_index}")
+            _webcams[camera_index] = cap
+
+        # Grab then retrieve to force a fresh frame instead of a queued one
+        ret = cap.grab()
+        if ret:
+            ret, frame = cap.retrieve()
         if not ret:
+            # Drop the handle so the next capture reopens the device
+            cap.release()
+            del _webcams[camera_index]
             raise RuntimeError("Failed to capture frame from webcam")
 
-        # Convert BGR (OpenCV default) to RGB for PIL
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Convert to PIL Image
-        img = Image.fromarray(frame_rgb)
-
-        # Convert to PNG bytes
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        return buffer.getvalue()
-    finally:
-        cap.release()
+    # OpenCV frames are already BGR, so encode directly without PIL
+    return encode_bgr(fit_frame(frame, max_side))
 
 
 def stitch_images(images: list[bytes], labels: list[str] | None = None, scale_factors: list[float] | None = None) -> bytes:
@@ -90,80 +337,184 @@ def stitch_images(images: list[bytes], labels: list[str] | None = None, scale_fa
     Stitch multiple images into a single image (vertically stacked).
 
     Args:
-        images: List of PNG image bytes
+        images: List of encoded image bytes (PNG or JPEG)
         labels: Optional labels to add above each image
         scale_factors: Optional scale factor for each image (e.g., 3.0 to make 3x bigger)
 
     Returns:
-        PNG image bytes of the combined image
+        Image bytes of the combined image in IMAGE_FORMAT
     """
-    from PIL import ImageDraw, ImageFont
-
-    pil_images = [Image.open(io.BytesIO(img_bytes)) for img_bytes in images]
-
-    # Apply scale factors if provided
-    if scale_factors:
-        scaled_images = []
-        for i, img in enumerate(pil_images):
-            if i < len(scale_factors) and scale_factors[i] != 1.0:
-                new_width = int(img.width * scale_factors[i])
-                new_height = int(img.height * scale_factors[i])
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            scaled_images.append(img)
-        pil_images = scaled_images
+    frames = []
+    for i, img_bytes in enumerate(images):
+        # Decode straight to a BGR array (grayscale/alpha inputs become 3-channel)
+        frame = cv2.imdecode(np.frombuffer(img_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise RuntimeError(f"Failed to decode image {i} for stitching")
+
+        # Apply scale factor if provided
+        if scale_factors and i < len(scale_factors) and scale_factors[i] != 1.0:
+            new_width = int(frame.shape[1] * scale_factors[i])
+            new_height = int(frame.shape[0] * scale_factors[i])
+            interpolation = cv2.INTER_LANCZOS4 if HQ_SCALE else cv2.INTER_LINEAR
+            frame = cv2.resize(frame, (new_width, new_height), interpolation=interpolation)
+
+        frames.append(frame)
 
     # Calculate total dimensions
-    max_width = max(img.width for img in pil_images)
     label_height = 30 if labels else 0
-    total_height = sum(img.height + label_height for img in pil_images)
+    has_label = [bool(labels) and i < len(labels) for i in range(len(frames))]
+    max_width = max(frame.shape[1] for frame in frames)
+    total_height = sum(
+        frame.shape[0] + (label_height if labeled else 0)
+        for frame, labeled in zip(frames, has_label)
+    )
 
-    # Create combined image
-    combined = Image.new("RGB", (max_width, total_height), color=(30, 30, 30))
+    # Preallocate the combined canvas and copy each frame in with a slice
+    canvas = np.full((total_height, max_width, 3), 30, dtype=np.uint8)
 
     y_offset = 0
-    for i, img in enumerate(pil_images):
-        # Add label if provided
-        if labels and i < len(labels):
-            draw = ImageDraw.Draw(combined)
-            try:
-                font = ImageFont.truetype("arial.ttf", 20)
-            except (OSError, IOError):
-                font = ImageFont.load_default()
-            draw.text((10, y_offset + 5), labels[i], fill=(255, 255, 255), font=font)
+    for i, frame in enumerate(frames):
+        if has_label[i]:
+            cv2.putText(
+                canvas, labels[i], (10, y_offset + 22), cv2.FONT_HERSHEY_SIMPLEX,
+                0.7, (255, 255, 255), 1, cv2.LINE_AA
+            )
             y_offset += label_height
 
-        # Paste image (centered if narrower than max width)
-        x_offset = (max_width - img.width) // 2
-        combined.paste(img, (x_offset, y_offset))
-        y_offset += img.height
+        # Centered if narrower than max width
+        height, width = frame.shape[:2]
+        x_offset = (max_width - width) // 2
+        canvas[y_offset:y_offset + height, x_offset:x_offset + width] = frame
+        y_offset += height
+
+    return encode_bgr(canvas)
+
+
+def fit_frame(frame: np.ndarray, max_side: int) -> np.ndarray:
+    """Shrink a numpy frame so its longest side is at most max_side pixels (0 keeps it as is)."""
+    height, width = frame.shape[:2]
+    if max_side <= 0 or max(height, width) <= max_side:
+        return frame
+    scale = max_side / max(height, width)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
 
-    # Convert to PNG bytes
-    buffer = io.BytesIO()
-    combined.save(buffer, format="PNG")
-    return buffer.getvalue()
 
+def _capture_dxcam(monitor_number: int, max_side: int) -> bytes | None:
+    """Capture a monitor via DXGI, or None if dxcam can't provide it.
 
-def capture_screenshot(monitor_number: int = 1) -> bytes:
+    Reuses the previous encoded image when the desktop hasn't presented a new frame.
+    """
+    if dxcam is None or monitor_number < 1:
+        return None
+
+    try:
+        with _dxcam_lock:
+            if monitor_number not in _dxcams:
+                cam = dxcam.create(output_idx=monitor_number - 1, output_color="BGR")
+                _dxcams[monitor_number] = (cam, threading.Lock())
+            cam, cam_lock = _dxcams[monitor_number]
+
+        with cam_lock:
+            frame = cam.grab()
+            if frame is None and (monitor_number, max_side) in _dxcam_last:
+                return _dxcam_last[monitor_number, max_side]
+            if frame is None:
+                return None
+
+            image_bytes = encode_bgr(fit_frame(frame, max_side))
+            _dxcam_last[monitor_number, max_side] = image_bytes
+            return image_bytes
+    except Exception as e:
+        print(f"dxcam capture failed for monitor {monitor_number}: {e}")
+        return None
+
+
+def capture_screenshot(monitor_number: int = 1, max_side: int = 0) -> bytes:
     """
     Capture a screenshot of the specified monitor.
 
     Args:
         monitor_number: Monitor index (1 = primary monitor, 0 = all monitors combined)
+        max_side: Shrink the capture so its longest side is at most this many pixels (0 = full size)
 
     Returns:
-        PNG image bytes
+        Image bytes in IMAGE_FORMAT
     """
-    with mss.mss() as sct:
-        monitor = sct.monitors[monitor_number]
-        screenshot = sct.grab(monitor)
+    return _grab_screenshot(monitor_number, max_side)[0]
+
+
+def _grab_screenshot(monitor_number: int, max_side: int) -> tuple[bytes, str]:
+    """Capture a monitor, returning the image and the backend that produced it ("dxcam" or "mss")."""
+    image_bytes = _capture_dxcam(monitor_number, max_side)
+    if image_bytes is not None:
+        return image_bytes, "dxcam"
+
+    sct = _sct()
+    screenshot = sct.grab(_monitors()[monitor_number])
+
+    # View the raw BGRA grab buffer as BGR without copying (.bgra makes a copy),
+    # shrink it if asked and encode straight from it with OpenCV, skipping PIL
+    bgra = np.frombuffer(screenshot.raw, np.uint8).reshape(screenshot.height, screenshot.width, 4)
+    return encode_bgr(fit_frame(bgra[:, :, :3], max_side)), "mss"
+
+
+def capture_all(
+    include_monitors: bool = True,
+    include_webcam: bool = True,
+    webcam_scale: float = 1.0,
+    max_side: int = 0
+) -> tuple[list[bytes], list[str], list[float], list[str]]:
+    """
+    Capture all monitors and the webcam concurrently.
+
+    Each grab blocks on an OS call (screen blit or camera read), so the
+    grabs are submitted to a thread pool and run in parallel. Results are
+    returned in a stable order: monitors first, then the webcam.
+
+    Args:
+        include_monitors: Whether to include monitor screenshots
+        include_webcam: Whether to include webcam capture
+        webcam_scale: Scale factor for webcam image (1.0 = keep the WEBCAM_MAX_SIDE thumbnail as is)
+        max_side: Longest side in pixels for each monitor capture (0 = full size)
 
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+    Returns:
+        Tuple of (images, labels, scale_factors, backends), where backends names the
+        screenshot backend behind each monitor image ("webcam" for the webcam)
+    """
+    monitor_count = get_monitor_count() if include_monitors else 0
+    webcam_count = get_webcam_count() if include_webcam else 0
 
-        # Convert to PNG bytes
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        return buffer.getvalue()
+    images = []
+    labels = []
+    scale_factors = []
+    backends = []
+
+    pool = _get_capture_pool(monitor_count + 1)
+
+    # (label, scale, future) in the order images should appear
+    pending = [
+        (f"Monitor {i}", 1.0, pool.submit(_grab_screenshot, i, max_side))
+        for i in range(1, monitor_count + 1)
+    ]
+    if webcam_count > 0:
+        pending.append(("Webcam", webcam_scale, pool.submit(capture_webcam, 0, WEBCAM_MAX_SIDE)))
+
+    for label, scale, future in pending:
+        try:
+            # Monitor grabs also report their backend
+            image, backend = future.result() if label != "Webcam" else (future.result(), "webcam")
+        except RuntimeError as e:
+            if label != "Webcam":
+                raise
+            print(f"Webcam capture failed: {e}")
+            continue
+        images.append(image)
+        labels.append(label)
+        scale_factors.append(scale)
+        backends.append(backend)
+
+    return images, labels, scale_factors, backends
 
 
 def capture_and_describe(
@@ -202,7 +553,7 @@ def capture_and_describe(
 
     backend = "local Ollama" if is_local_model(model) else "OpenAI"
     print(f"Sending to {backend} ({model}) for analysis...")
-    description = complete_vision(image_bytes, prompt=prompt, model=model)
+    description = complete_vision(downscale_image(image_bytes), prompt=prompt, model=model)
 
     if save_results:
         image_path, text_path = save_screenshot_with_analysis(image_bytes, description)
@@ -212,11 +563,47 @@ def capture_and_describe(
     return description
 
 
+async def capture_and_describe_async(
+    prompt: str = "Briefly describe what you see in this image.",
+    monitor_number: int = 0,
+    webcam: bool = False,
+    camera_index: int = 0,
+    model: str | None = None,
+    save_results: bool = False
+) -> str:
+    """
+    Async version of capture_and_describe.
+
+    The capture runs in a worker thread and the vision request is awaited,
+    so several captures can be described concurrently.
+
+    Takes the same arguments as capture_and_describe.
+
+    Returns:
+        Description from OpenAI Vision API or local LLM
+    """
+    model = model or SCREENSHOT_MODEL
+
+    if webcam:
+        image_bytes = await asyncio.to_thread(capture_webcam, camera_index)
+    else:
+        image_bytes = await asyncio.to_thread(capture_screenshot, monitor_number)
+
+    description = await complete_vision_async(downscale_image(image_bytes), prompt=prompt, model=model)
+
+    if save_results:
+        image_path, text_path = await asyncio.to_thread(save_screenshot_with_analysis, image_bytes, description)
+        print(f"Capture saved to {image_path}")
+        print(f"Analysis saved to {text_path}")
+
+    return description
+
+
 def capture_all_and_describe(
     prompt: str = "Describe what you see. The image contains screenshots from monitors and webcam captures.",
     include_monitors: bool = True,
     include_webcam: bool = True,
-    webcam_scale: float = 3.0,
+    webcam_scale: float = 1.0,
     model: str | None = None,
     save_results: bool = False
 ) -> str:
@@ -227,7 +614,7 @@ def capture_all_and_describe(
         prompt: The question/prompt to ask about the combined image
         include_monitors: Whether to include monitor screenshots
         include_webcam: Whether to include webcam capture
-        webcam_scale: Scale factor for webcam image (default 3.0 = 3x bigger)
+        webcam_scale: Scale factor for webcam image (1.0 = keep the WEBCAM_MAX_SIDE thumbnail as is)
         model: Model to use (defaults to SCREENSHOT_MODEL)
         save_results: Whether to save capture and analysis to results folders
 
@@ -235,30 +622,9 @@ def capture_all_and_describe(
         Description from OpenAI Vision API or local LLM
     """
     model = model or SCREENSHOT_MODEL
-    images = []
-    labels = []
-    scale_factors = []
 
-    # Capture all monitors
-    if include_monitors:
-        monitor_count = get_monitor_count()
-        for i in range(1, monitor_count + 1):
-            print(f"Capturing monitor {i}...")
-            images.append(capture_screenshot(i))
-            labels.append(f"Monitor {i}")
-            scale_factors.append(1.0)
-
-    # Capture webcam
-    if include_webcam:
-        webcam_count = get_webcam_count()
-        if webcam_count > 0:
-            print("Capturing webcam...")
-            try:
-                images.append(capture_webcam(0))
-                labels.append("Webcam")
-                scale_factors.append(webcam_scale)
-            except RuntimeError as e:
-                print(f"Webcam capture failed: {e}")
+    print("Capturing monitors and webcam...")
+    images, labels, scale_factors, _ = capture_all(include_monitors, include_webcam, webcam_scale)
 
     if not images:
         raise RuntimeError("No images captured")
@@ -268,13 +634,13 @@ def capture_all_and_describe(
     if SEND_IMAGES_SEPARATELY:
         # Send all images together in one prompt
         print(f"Sending {len(images)} images to {backend} ({model}) for analysis...")
-        description = complete_vision(images, prompt=prompt, model=model)
+        description = complete_vision([downscale_image(img) for img in images], prompt=prompt, model=model)
     else:
         # Stitch all images together into one
         print("Stitching images together...")
         combined_image = stitch_images(images, labels, scale_factors)
         print(f"Sending combined image to {backend} ({model}) for analysis...")
-        description = complete_vision(combined_image, prompt=prompt, model=model)
+        description = complete_vision(downscale_image(combined_image), prompt=prompt, model=model)
 
     if save_results:
         if SEND_IMAGES_SEPARATELY:
@@ -294,6 +660,54 @@ def capture_all_and_describe(
     return description
 
 
+def capture_all_and_describe_multi(
+    prompt: str = "Describe what you see in the monitor screenshots and webcam capture.",
+    include_monitors: bool = True,
+    include_webcam: bool = True,
+    model: str | None = None,
+    save_results: bool = False
+) -> str:
+    """
+    Capture all monitors and webcam and send them as separate images in one request.
+
+    Skips stitching on the hot path so the model's vision preprocessor can
+    tile each image at its own resolution. A preamble tells the model which
+    image is which.
+
+    Args:
+        prompt: The question/prompt to ask about the images
+        include_monitors: Whether to include monitor screenshots
+        include_webcam: Whether to include webcam capture
+        model: Model to use (defaults to SCREENSHOT_MODEL)
+        save_results: Whether to save a stitched capture and the analysis to results folders
+
+    Returns:
+        Description from OpenAI Vision API or local LLM
+    """
+    model = model or SCREENSHOT_MODEL
+
+    print("Capturing monitors and webcam...")
+    images, labels, scale_factors, _ = capture_all(include_monitors, include_webcam, webcam_scale=1.0)
+
+    if not images:
+        raise RuntimeError("No images captured")
+
+    order = ", ".join(f"{i}) {label}" for i, label in enumerate(labels, start=1))
+    full_prompt = f"The {len(images)} images are, in order: {order}.\n\n{prompt}"
+
+    backend = "local Ollama" if is_local_model(model) else "OpenAI"
+    print(f"Sending {len(images)} images to {backend} ({model}) for analysis...")
+    description = complete_vision([downscale_image(img) for img in images], prompt=full_prompt, model=model)
+
+    if save_results:
+        combined_image = stitch_images(images, labels, scale_factors)
+        image_path, text_path = save_screenshot_with_analysis(combined_image, description)
+        print(f"Combined capture saved to {image_path}")
+        print(f"Analysis saved to {text_path}")
+
+    return description
+
+
 if __name__ == "__main__":
     if not is_local_model(SCREENSHOT_MODEL) and not os.environ.get("OPENAI_API_KEY"):
         print("Error: OPENAI_API_KEY environment variable not set.")
@@ -1,6 +1,10 @@
 """Configuration constants for the Deep Work script."""
 
 import os
+import sys
+
+# The blocking features (hosts file, process killing, admin elevation) are Windows-only
+IS_WINDOWS = sys.platform == "win32"
 
 # Monitoring configuration
 # CAPTURE_INTERVAL_SECONDS = float(os.environ.get("CAPTURE_INTERVAL_SECONDS", "5"))
@@ -9,11 +13,23 @@ import os
 CAPTURE_INTERVAL_SECONDS = float(os.environ.get("CAPTURE_INTERVAL_SECONDS", "60"))
 CAPTURES_BEFORE_ANALYSIS = int(os.environ.get("CAPTURES_BEFORE_ANALYSIS", "5"))
 
+# OpenAI image detail for productivity analysis: "low" (fewest tokens), "high" or "auto"
+VISION_DETAIL = os.environ.get("VISION_DETAIL", "auto")
+
+# Report "not productive" without calling the LLM when every capture in a batch is
+# byte-identical, i.e. the screen stood still
+SKIP_STATIC_SCREENS = os.environ.get("SKIP_STATIC_SCREENS", "true").lower() == "true"
+
+# When WMI process-start events are unavailable the killer polls: every KILLER_MIN_POLL_SECONDS
+# right after a kill, backing off by 1.5x per empty sweep up to KILLER_MAX_POLL_SECONDS
+KILLER_MIN_POLL_SECONDS = 0.25
+KILLER_MAX_POLL_SECONDS = float(os.environ.get("KILLER_MAX_POLL_SECONDS", "10"))
+
 # Speak positive TTS feedback every N times (1 = every time, 6 = every 6th time)
 POSITIVE_TTS_EVERY_N = int(os.environ.get("POSITIVE_TTS_EVERY_N", "6"))
 
-# Websites to block (add more if needed)
-WEBSITES_TO_BLOCK = [
+# Websites to block (add more if needed; duplicates are removed below)
+_WEBSITES_TO_BLOCK_RAW = [
     "facebook.com",
     "www.facebook.com",
     "linkedin.com",
@@ -58,7 +74,6 @@ WEBSITES_TO_BLOCK = [
     "twitter.su",
     "twitter.vn",
     "twitter.com",
-    "*.twitter.com",
     "twitter.gd",
     "twitter.im",
     "twitter.hk",
@@ -95,6 +110,12 @@ WEBSITES_TO_BLOCK = [
     "api.twitter.com",
 ]
 
+# Normalized and deduplicated in order; hosts files don't support wildcards, so skip those
+WEBSITES_TO_BLOCK = tuple(
+    site for site in dict.fromkeys(h.strip().lower() for h in _WEBSITES_TO_BLOCK_RAW) if "*" not in site
+)
+assert len(WEBSITES_TO_BLOCK) == len(set(WEBSITES_TO_BLOCK))
+
 # Applications to block (Executable Name: Full Path)
 # !! IMPORTANT !! Update these paths if your installations are different!
 # Common locations are used below. Check your system.
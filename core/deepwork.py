@@ -1,6 +1,6 @@
 """Deep Work session management with integrated productivity monitoring."""
 
-from .prompts import PRODUCTIVITY_PROMPT_TEMPLATE
+from .prompts import build_prompt
 from .hosts import modify_hosts
 from .workers import ProcessKillerThread, ProductivityMonitorThread, BreakTimer
 
@@ -17,15 +17,19 @@ class DeepWorkWithMonitoring:
     def __init__(self, task: str):
         self.task = task
         self.current_mode = "on"
-        self.break_remaining = 0
         self.last_analysis = ""
         self.is_productive = True
 
-        prompt = PRODUCTIVITY_PROMPT_TEMPLATE.format(task=task)
+        prompt = build_prompt(task)
         self._killer = ProcessKillerThread()
         self._monitor = ProductivityMonitorThread(prompt, self._on_analysis)
         self._break_timer: BreakTimer | None = None
 
+    @property
+    def break_remaining(self) -> int:
+        """Seconds left in the current break (0 when not on break)."""
+        return self._break_timer.remaining if self._break_timer else 0
+
     def _on_analysis(self, analysis: str, is_productive: bool):
         """Callback when productivity analysis completes."""
         self.last_analysis = analysis
@@ -51,25 +55,15 @@ class DeepWorkWithMonitoring:
 
     def set_off(self):
         """Deactivate deep work mode."""
-        self._cancel_break()
-        self._killer.stop()
-        self._monitor.stop()
-        modify_hosts(block=False)
+        self._teardown()
         self.current_mode = "off"
 
     def set_break(self, minutes: float):
         """Enter break mode for specified duration."""
-        self._cancel_break()
-        self._killer.stop()
-        self._monitor.stop()
-        modify_hosts(block=False)
+        self._teardown()
         self.current_mode = "break"
 
-        self._break_timer = BreakTimer(
-            minutes,
-            on_tick=lambda remaining: setattr(self, 'break_remaining', remaining),
-            on_complete=self._on_break_complete,
-        )
+        self._break_timer = BreakTimer(minutes, on_complete=self._on_break_complete)
         self._break_timer.start()
 
     def _cancel_break(self):
@@ -78,9 +72,13 @@ class DeepWorkWithMonitoring:
             self._break_timer.stop(timeout=2.0)
             self._break_timer = None
 
-    def cleanup(self):
-        """Stop all threads and unblock sites."""
+    def _teardown(self):
+        """Cancel any break, stop the workers and unblock sites."""
         self._cancel_break()
         self._killer.stop()
         self._monitor.stop()
         modify_hosts(block=False)
+
+    def cleanup(self):
+        """Stop all threads and unblock sites."""
+        self._teardown()
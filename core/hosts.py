@@ -1,44 +1,208 @@
 """Hosts file management for blocking websites."""
 
+import contextlib
+import hashlib
+import json
+import mmap
+import os
 import sys
+import threading
+import time
+
+# Byte-range locks on a sidecar file keep other hosts editors out while we rewrite (Windows only)
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 from .config import HOSTS_FILE_PATH, REDIRECT_IP, HOSTS_MARKER, WEBSITES_TO_BLOCK
 from .utils import flush_dns
+from .logs import get_logger
+
+log = get_logger(__name__)
+
+# The Windows resolver reads at most 9 hostnames per hosts line
+HOSTS_PER_LINE = 9
+
+# Block lines are constant, so build them once instead of on every toggle
+_BLOCK_LINES = "".join(
+    f"{REDIRECT_IP}\t{' '.join(WEBSITES_TO_BLOCK[i:i + HOSTS_PER_LINE])}\t{HOSTS_MARKER}{os.linesep}"
+    for i in range(0, len(WEBSITES_TO_BLOCK), HOSTS_PER_LINE)
+).encode()
+
+# Where the last applied state is kept between runs, so even the first toggle after a
+# restart can be a single stat() ("" keeps it in memory only)
+_STATE_DIR = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+HOSTS_STATE_FILE = os.environ.get("HOSTS_STATE_FILE", os.path.join(_STATE_DIR, "deepwork_hosts_state.json"))
+
+# Advisory lock file shared by every running copy of this script, kept out of the etc directory
+_HOSTS_LOCK_FILE = os.path.join(_STATE_DIR, "deepwork_hosts.lock")
+
+# Identifies the block list, so a saved state from a different WEBSITES_TO_BLOCK is ignored
+_BLOCKLIST_DIGEST = hashlib.blake2b(_BLOCK_LINES, digest_size=8).hexdigest()
+
+# (block, mtime_ns, size) of the hosts file as we last left it, so a repeated
+# toggle to the same state costs one stat() instead of a read
+_last_state: tuple[bool, int, int] | None = None
+_state_loaded = False
+
+# Defender or the DNS client briefly holding the hosts file open makes writes fail with a
+# sharing violation, so retry a few times before giving up
+_WRITE_ATTEMPTS = 5
+_WRITE_RETRY_SECONDS = 0.2
+
+# Serializes toggles within this process (e.g. a break ending while the user types "off")
+_hosts_lock = threading.Lock()
+
+
+def _load_state():
+    """Load the state saved by a previous run, once per process."""
+    global _last_state, _state_loaded
+    _state_loaded = True
+    if not HOSTS_STATE_FILE:
+        return
+    try:
+        with open(HOSTS_STATE_FILE, encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("blocklist") == _BLOCKLIST_DIGEST:
+            _last_state = (bool(saved["blocked"]), int(saved["mtime_ns"]), int(saved["size"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing or unreadable: fall back to scanning the hosts file
+        pass
+
+
+def _remember_state(block: bool):
+    global _last_state
+    st = os.stat(HOSTS_FILE_PATH)
+    _last_state = (block, st.st_mtime_ns, st.st_size)
+    if not HOSTS_STATE_FILE:
+        return
+    state = {"blocked": block, "mtime_ns": st.st_mtime_ns, "size": st.st_size, "blocklist": _BLOCKLIST_DIGEST}
+    try:
+        with open(HOSTS_STATE_FILE, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+    except OSError as e:
+        log.warning("Could not save hosts state: %s", e)
+
+
+@contextlib.contextmanager
+def _locked_hosts():
+    """Hold the in-process lock and, on Windows, an advisory lock shared with other instances."""
+    with _hosts_lock:
+        if msvcrt is None:
+            yield
+            return
+        with open(_HOSTS_LOCK_FILE, "a+b") as lock_file:
+            lock_file.seek(0)
+            # LK_LOCK retries for about 10 seconds before raising OSError
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def _mapped(path: str):
+    """Map a file read-only (an empty file yields b"", which supports the same find/slice calls)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _marker_spans(data, marker: bytes) -> list[tuple[int, int]]:
+    """Find the (start, end) byte range of every line containing marker, newline included."""
+    spans = []
+    pos = 0
+    while (hit := data.find(marker, pos)) != -1:
+        start = data.rfind(b"\n", 0, hit) + 1
+        end = data.find(b"\n", hit)
+        end = len(data) if end == -1 else end + 1
+        spans.append((start, end))
+        pos = end
+    return spans
+
+
+def _marker_lines(path: str, marker: bytes) -> bytes:
+    """Return only the lines containing marker, jumping between matches in the mapped file."""
+    with _mapped(path) as data:
+        return b"".join(data[start:end] for start, end in _marker_spans(data, marker))
+
+
+def _rewrite_in_place(path: str, marker: bytes, block_lines: bytes):
+    """Rewrite path without its marker lines plus block_lines, keeping the file (and its ACL) in place."""
+    with _mapped(path) as data:
+        # Keep the byte ranges between marker lines straight from the mapping
+        parts = []
+        pos = 0
+        ends_with_newline = True
+        for start, end in [*_marker_spans(data, marker), (len(data), len(data))]:
+            if start > pos:
+                parts.append(data[pos:start])
+                ends_with_newline = data[start - 1:start] == b"\n"
+            pos = end
+    if block_lines:
+        if not ends_with_newline:
+            parts.append(os.linesep.encode())
+        parts.append(block_lines)
+    contents = b"".join(parts)
+
+    # The mapping is closed by now; Windows cannot truncate a mapped file
+    for attempt in range(_WRITE_ATTEMPTS):
+        try:
+            with open(path, "r+b") as f:
+                f.write(contents)
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+            return
+        except PermissionError:
+            if attempt == _WRITE_ATTEMPTS - 1:
+                raise
+            time.sleep(_WRITE_RETRY_SECONDS)
 
 
 def modify_hosts(block=True):
     """Add or remove entries from the hosts file."""
-    print(f"{'Blocking' if block else 'Unblocking'} websites in hosts file...")
+    log.info("%s websites in hosts file...", "Blocking" if block else "Unblocking")
     try:
-        with open(HOSTS_FILE_PATH, 'r') as f:
-            lines = f.readlines()
-
-        # Filter out existing blocked lines first
-        filtered_lines = [line for line in lines if HOSTS_MARKER not in line]
-
-        if block:
-            # Add new block lines
-            for site in WEBSITES_TO_BLOCK:
-                filtered_lines.append(f"{REDIRECT_IP}\t{site}\t\t{HOSTS_MARKER}\n")
-            action = "blocked"
-        else:
-            # Just keep the filtered lines (removes the blocks)
-            action = "unblocked"
-
-        # Write the modified content back
-        with open(HOSTS_FILE_PATH, 'w') as f:
-            f.writelines(filtered_lines)
-
-        print(f"Websites {action} successfully.")
-        if block or any(HOSTS_MARKER in line for line in lines):
+        with _locked_hosts():
+            if not _state_loaded:
+                _load_state()
+            if _last_state is not None:
+                st = os.stat(HOSTS_FILE_PATH)
+                if _last_state == (block, st.st_mtime_ns, st.st_size):
+                    log.info("Websites already %s.", "blocked" if block else "unblocked")
+                    return
+
+            marker = HOSTS_MARKER.encode()
+
+            # Skip the write and DNS flush if the file already holds exactly the wanted
+            # block lines (wherever they sit) or none of them
+            if _marker_lines(HOSTS_FILE_PATH, marker) == (_BLOCK_LINES if block else b""):
+                log.info("Websites already %s.", "blocked" if block else "unblocked")
+                _remember_state(block)
+                return
+
+            # Drop existing block lines and, when blocking, append the new ones
+            _rewrite_in_place(HOSTS_FILE_PATH, marker, _BLOCK_LINES if block else b"")
+            _remember_state(block)
+            action = "blocked" if block else "unblocked"
+
+            log.info("Websites %s successfully.", action)
+            # Any write reaching here changed the block lines
             flush_dns()
 
     except FileNotFoundError:
-        print(f"Error: Hosts file not found at {HOSTS_FILE_PATH}")
+        log.error("Hosts file not found at %s", HOSTS_FILE_PATH)
         sys.exit(1)
     except PermissionError:
-        print(f"Error: Permission denied writing to {HOSTS_FILE_PATH}. Run as Administrator.")
+        log.error("Permission denied writing to %s. Run as Administrator.", HOSTS_FILE_PATH)
         sys.exit(1)
     except Exception as e:
-        print(f"An error occurred modifying the hosts file: {e}")
+        log.error("An error occurred modifying the hosts file: %s", e)
         sys.exit(1)
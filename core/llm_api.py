@@ -5,10 +5,28 @@ Provides functions for text and vision completions.
 Supports both OpenAI API and local models via Ollama.
 """
 
+import asyncio
 import base64
+import functools
 import os
+import re
+
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+# pybase64 is a SIMD-accelerated drop-in for base64, used when installed
+try:
+    import pybase64 as _base64
+except ImportError:
+    _base64 = base64
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 # Load environment variables from .env file
 load_dotenv()
@@ -20,34 +38,127 @@ DEFAULT_MODEL = os.environ.get("DEFAULT_MODEL", "gpt-5-nano")
 # Ollama base URL for local models
 OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434/v1")
 
+# Ollama's native API root (OLLAMA_BASE_URL points at its OpenAI-compatible /v1)
+OLLAMA_NATIVE_URL = OLLAMA_BASE_URL.rstrip("/").removesuffix("/v1")
+
+# Local Ollama model names: "name:tag" or a known local model family prefix
+_LOCAL_MODEL_RE = re.compile(r"^(?:gemma|llama|mistral|phi|qwen)|:")
+
+# Matches the "N)" answer markers in a batched vision response
+_ANSWER_MARKER_RE = re.compile(r"^\s*(\d+)\)\s*", re.MULTILINE)
+
+# Request timeout for LLM calls (local vision models on CPU can be slow)
+LLM_TIMEOUT_SECONDS = float(os.environ.get("LLM_TIMEOUT_SECONDS", "300"))
 
+# Retries with exponential backoff for transient API errors
+LLM_MAX_RETRIES = 3
+
+# Keep-alive pool shared by all requests to a backend
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=120)
+
+
+@functools.lru_cache(maxsize=64)
 def is_local_model(model: str) -> bool:
     """Check if a model name refers to a local Ollama model."""
     # Ollama models typically have format "name:tag" or known local prefixes
-    return ":" in model or model.startswith(("gemma", "llama", "mistral", "phi", "qwen"))
+    return bool(_LOCAL_MODEL_RE.search(model))
+
+
+@functools.lru_cache(maxsize=4)
+def _client(kind: str) -> OpenAI:
+    """Create the OpenAI client for a backend ("ollama" or "openai") once per process."""
+    if kind == "ollama":
+        return OpenAI(
+            base_url=OLLAMA_BASE_URL,
+            api_key="ollama",  # Ollama doesn't require a real API key
+            http_client=httpx.Client(limits=_HTTP_LIMITS, timeout=LLM_TIMEOUT_SECONDS),
+            max_retries=LLM_MAX_RETRIES,
+        )
+    # The OpenAI API speaks HTTP/2: one multiplexed connection for concurrent requests
+    http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=LLM_TIMEOUT_SECONDS, http2=_HTTP2)
+    return OpenAI(http_client=http_client, max_retries=LLM_MAX_RETRIES)
+
+
+@functools.lru_cache(maxsize=4)
+def _async_client(kind: str) -> AsyncOpenAI:
+    """Create the AsyncOpenAI client for a backend once per process."""
+    if kind == "ollama":
+        return AsyncOpenAI(
+            base_url=OLLAMA_BASE_URL,
+            api_key="ollama",
+            http_client=httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=LLM_TIMEOUT_SECONDS),
+            max_retries=LLM_MAX_RETRIES,
+        )
+    http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=LLM_TIMEOUT_SECONDS, http2=_HTTP2)
+    return AsyncOpenAI(http_client=http_client, max_retries=LLM_MAX_RETRIES)
+
+
+@functools.lru_cache(maxsize=1)
+def _ollama_http() -> httpx.Client:
+    """Create the HTTP client for Ollama's native API once per process."""
+    return httpx.Client(
+        base_url=OLLAMA_NATIVE_URL,
+        limits=_HTTP_LIMITS,
+        timeout=LLM_TIMEOUT_SECONDS,
+        transport=httpx.HTTPTransport(retries=LLM_MAX_RETRIES),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _ollama_http_async() -> httpx.AsyncClient:
+    """Create the async HTTP client for Ollama's native API once per process."""
+    return httpx.AsyncClient(
+        base_url=OLLAMA_NATIVE_URL,
+        limits=_HTTP_LIMITS,
+        timeout=LLM_TIMEOUT_SECONDS,
+        transport=httpx.AsyncHTTPTransport(retries=LLM_MAX_RETRIES),
+    )
 
 
 def get_client(model: str) -> OpenAI:
     """
     Get OpenAI client instance based on model.
 
+    Clients are cached per backend so HTTP connections are kept alive
+    between calls instead of paying a new TLS handshake every time.
+
     Args:
         model: Model name (local models use Ollama, others use OpenAI)
 
     Returns:
         OpenAI client configured for either OpenAI API or local Ollama.
     """
-    if is_local_model(model):
-        return OpenAI(
-            base_url=OLLAMA_BASE_URL,
-            api_key="ollama"  # Ollama doesn't require a real API key
-        )
-    return OpenAI()
+    return _client("ollama" if is_local_model(model) else "openai")
+
+
+def get_async_client(model: str) -> AsyncOpenAI:
+    """
+    Get a cached AsyncOpenAI client instance based on model.
+
+    Args:
+        model: Model name (local models use Ollama, others use OpenAI)
+
+    Returns:
+        AsyncOpenAI client configured for either OpenAI API or local Ollama.
+    """
+    return _async_client("ollama" if is_local_model(model) else "openai")
 
 
 def encode_image_to_base64(image_bytes: bytes) -> str:
     """Encode image bytes to base64 string."""
-    return base64.b64encode(image_bytes).decode("utf-8")
+    return _base64.b64encode(image_bytes).decode("ascii")
+
+
+def get_image_mime_type(image_bytes: bytes) -> str:
+    """Detect the MIME type of encoded image bytes from their magic number."""
+    if image_bytes.startswith(b"\x89PNG"):
+        return "image/png"
+    return "image/jpeg"
+
+
+def to_data_url(image_bytes: bytes) -> str:
+    """Build a base64 data URL for encoded image bytes."""
+    return f"data:{get_image_mime_type(image_bytes)};base64,{encode_image_to_base64(image_bytes)}"
 
 
 def complete_text(
@@ -85,6 +196,50 @@ def complete_text(
     return response.choices[0].message.content
 
 
+def _build_vision_request(
+    images: bytes | list[bytes],
+    prompt: str,
+    model: str,
+    max_completion_tokens: int,
+    detail: str
+) -> tuple[str, dict]:
+    """
+    Build the API call for a vision request.
+
+    Returns:
+        ("ollama", payload) for Ollama's native /api/generate or
+        ("responses", kwargs) for responses.create (OpenAI)
+    """
+    # Normalize to list
+    if isinstance(images, bytes):
+        images = [images]
+
+    if is_local_model(model):
+        # Ollama: native generate API takes plain base64 images, no data URLs
+        return "ollama", {
+            "model": model,
+            "prompt": prompt,
+            "images": [encode_image_to_base64(img) for img in images],
+            "stream": False,
+            "options": {"num_predict": max_completion_tokens},
+        }
+
+    # OpenAI GPT-5: use Responses API with input_text/input_image
+    content = [{"type": "input_text", "text": prompt}]
+    for img in images:
+        content.append({
+            "type": "input_image",
+            "image_url": to_data_url(img),
+            "detail": detail
+        })
+
+    return "responses", {
+        "model": model,
+        "input": [{"role": "user", "content": content}],
+        "max_output_tokens": max_completion_tokens,
+    }
+
+
 def complete_vision(
     images: bytes | list[bytes],
     prompt: str = "Briefly describe what you see in this image.",
@@ -95,6 +250,9 @@ def complete_vision(
     """
     Send one or more images to OpenAI Vision API or local LLM and get a description.
 
+    Local models are called through Ollama's native /api/generate, which
+    takes raw base64 images instead of data URLs in the OpenAI chat schema.
+
     Args:
         images: Image data as bytes, or list of image bytes for multiple images
         prompt: The question/prompt to ask about the image(s)
@@ -109,45 +267,114 @@ def complete_vision(
         Description text from the API
     """
     model = model or DEFAULT_MODEL
+
+    kind, kwargs = _build_vision_request(images, prompt, model, max_completion_tokens, detail)
+    if kind == "ollama":
+        response = _ollama_http().post("/api/generate", json=kwargs)
+        response.raise_for_status()
+        return response.json().get("response", "")
+
+    response = get_client(model).responses.create(**kwargs)
+    return response.output_text or ""
+
+
+async def complete_vision_async(
+    images: bytes | list[bytes],
+    prompt: str = "Briefly describe what you see in this image.",
+    model: str | None = None,
+    max_completion_tokens: int = 4000,
+    detail: str = "auto"
+) -> str:
+    """
+    Async version of complete_vision, for overlapping requests with other work.
+
+    Takes the same arguments as complete_vision.
+
+    Returns:
+        Description text from the API
+    """
+    model = model or DEFAULT_MODEL
+
+    # Base64-encoding multi-MB images is CPU work; keep it off the event loop
+    kind, kwargs = await asyncio.to_thread(
+        _build_vision_request, images, prompt, model, max_completion_tokens, detail
+    )
+    if kind == "ollama":
+        response = await _ollama_http_async().post("/api/generate", json=kwargs)
+        response.raise_for_status()
+        return response.json().get("response", "")
+
+    response = await get_async_client(model).responses.create(**kwargs)
+    return response.output_text or ""
+
+
+def complete_vision_batched(
+    items: list[tuple[bytes, str]],
+    model: str | None = None,
+    max_completion_tokens: int = 4000,
+    detail: str = "auto"
+) -> list[str]:
+    """
+    Answer several (image, question) pairs in a single vision request.
+
+    Packs every question and its image into one message so the shared
+    instructions are prefilled once, then splits the numbered reply.
+
+    Args:
+        items: List of (image_bytes, question) pairs
+        model: Model to use (defaults to DEFAULT_MODEL, auto-detects local vs OpenAI)
+        max_completion_tokens: Maximum tokens in the whole response
+        detail: Image detail level - "low", "high", or "auto"
+
+    Returns:
+        One answer per item, in order (empty string if the model skipped one)
+    """
+    if not items:
+        return []
+
+    model = model or DEFAULT_MODEL
     client = get_client(model)
 
-    # Normalize to list
-    if isinstance(images, bytes):
-        images = [images]
+    questions = "\n".join(f"{n}) {question}" for n, (_, question) in enumerate(items, start=1))
+    header = (
+        f"Answer each of the following {len(items)} questions in order. "
+        f"Question N refers to image N. Start each answer on a new line with \"N) \".\n{questions}"
+    )
 
     if is_local_model(model):
-        # Ollama: use chat completions API
-        content = [{"type": "text", "text": prompt}]
-        for img in images:
-            base64_image = encode_image_to_base64(img)
-            content.append({
-                "type": "image_url",
-                "image_url": {"url": f"data:image/png;base64,{base64_image}"}
-            })
+        content = [{"type": "text", "text": header}]
+        for n, (img, _) in enumerate(items, start=1):
+            content.append({"type": "text", "text": f"Image {n}:"})
+            content.append({"type": "image_url", "image_url": {"url": to_data_url(img)}})
 
         response = client.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": content}],
             max_completion_tokens=max_completion_tokens
         )
-        return response.choices[0].message.content or ""
+        text = response.choices[0].message.content or ""
     else:
-        # OpenAI GPT-5: use Responses API with input_text/input_image
-        content = [{"type": "input_text", "text": prompt}]
-        for img in images:
-            base64_image = encode_image_to_base64(img)
-            content.append({
-                "type": "input_image",
-                "image_url": f"data:image/png;base64,{base64_image}",
-                "detail": detail
-            })
+        content = [{"type": "input_text", "text": header}]
+        for n, (img, _) in enumerate(items, start=1):
+            content.append({"type": "input_text", "text": f"Image {n}:"})
+            content.append({"type": "input_image", "image_url": to_data_url(img), "detail": detail})
 
         response = client.responses.create(
             model=model,
             input=[{"role": "user", "content": content}],
             max_output_tokens=max_completion_tokens
         )
-        return response.output_text or ""
+        text = response.output_text or ""
+
+    # Split on "N)" markers and map each answer back to its question number
+    answers = [""] * len(items)
+    markers = list(_ANSWER_MARKER_RE.finditer(text))
+    for i, marker in enumerate(markers):
+        n = int(marker.group(1))
+        end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        if 1 <= n <= len(items) and not answers[n - 1]:
+            answers[n - 1] = text[marker.end():end].strip()
+    return answers
 
 
 # Alias for backwards compatibility
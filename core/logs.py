@@ -0,0 +1,35 @@
+"""
+Logging for the background workers.
+
+Records are queued by the calling thread and written to the console by a
+listener thread, so capture/kill loops never block on console output.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+# Minimum level to print: DEBUG, INFO, WARNING or ERROR
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def get_logger(name: str = "deepwork") -> logging.Logger:
+    """Get a logger under the "deepwork" hierarchy, setting up the queue on first use."""
+    global _listener
+    root = logging.getLogger("deepwork")
+    if _listener is None:
+        records: queue.Queue = queue.Queue(-1)
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter("%(message)s"))
+        _listener = logging.handlers.QueueListener(records, console, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        root.addHandler(logging.handlers.QueueHandler(records))
+        root.setLevel(LOG_LEVEL)
+        root.propagate = False
+    return root if name == "deepwork" else root.getChild(name)
@@ -1,58 +1,155 @@
 """Productivity monitoring helpers - capture, analysis, and TTS."""
 
+import asyncio
+import functools
+import hashlib
 import json
-from .capture_describer import (
-    capture_screenshot, capture_webcam, stitch_images,
-    get_monitor_count, get_webcam_count, SCREENSHOT_MODEL
-)
-from .llm_api import complete_vision, is_local_model
+import re
+import threading
+from collections import OrderedDict
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = (json.JSONDecodeError,)
+
+from .config import VISION_DETAIL
+from .capture_describer import capture_all, stitch_images, MAX_SIDE, SCREENSHOT_MODEL
+from .llm_api import complete_vision, complete_vision_async, is_local_model
 from .save_results import save_text, get_timestamp
 from .tts import speak
+from .logs import get_logger
+
+log = get_logger(__name__)
+
+# SCREENSHOT_MODEL is fixed for the session, so resolve its backend name once
+_ANALYSIS_BACKEND = "local Ollama" if is_local_model(SCREENSHOT_MODEL) else "OpenAI"
+
+# The verdict is a flat {"productive": ..., "reason": ...} object
+_JSON_OBJECT_RE = re.compile(r"\{[^{}]*\}")
+# How much of the tail the plain-text fallback looks at
+_FALLBACK_TAIL_CHARS = 512
+
+# Recent verdicts keyed by (prompt digest, concatenated monitor-frame digests), least recently used first
+VERDICT_CACHE_SIZE = 128
+_verdict_cache: OrderedDict[tuple[bytes, bytes], tuple[bool, str, str]] = OrderedDict()
+_verdict_cache_lock = threading.Lock()
 
 
 def parse_productivity_response(analysis: str) -> tuple[bool, str]:
     """Parse the LLM's JSON response to extract productivity status and reason."""
-    try:
-        start = analysis.find("{")
-        end = analysis.rfind("}") + 1
-        if start != -1 and end > start:
-            json_str = analysis[start:end]
-            data = json.loads(json_str)
-            productive = data.get("productive", "").lower() == "yes"
+    candidates = []
+    if match := _JSON_OBJECT_RE.search(analysis):
+        candidates.append(match.group(0))
+    start = analysis.find("{")
+    end = analysis.rfind("}") + 1
+    if start != -1 and end > start:
+        # Outermost braces, for replies whose reason itself contains braces
+        candidates.append(analysis[start:end])
+
+    for json_str in candidates:
+        try:
+            data = _json_loads(json_str)
+        except _JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            productive = str(data.get("productive", "")).lower() == "yes"
             reason = data.get("reason", "")
             return productive, reason
-    except json.JSONDecodeError:
-        pass
-    return "productive\": \"yes" in analysis.lower(), ""
+    return "productive\": \"yes" in analysis[-_FALLBACK_TAIL_CHARS:].lower(), ""
 
 
-def capture_all_stitched() -> bytes:
-    """Capture all monitors and webcam, return as single stitched image."""
-    images = []
-    labels = []
-    scale_factors = []
-
-    monitor_count = get_monitor_count()
-    for i in range(1, monitor_count + 1):
-        images.append(capture_screenshot(i))
-        labels.append(f"Monitor {i}")
-        scale_factors.append(1.0)
-
-    webcam_count = get_webcam_count()
-    if webcam_count > 0:
-        try:
-            images.append(capture_webcam(0))
-            labels.append("Webcam")
-            scale_factors.append(3.0)
-        except RuntimeError as e:
-            print(f"Webcam capture failed: {e}")
+def capture_frames() -> tuple[list[bytes], list[str], list[float], list[str]]:
+    """Capture all monitors (within SCREENSHOT_MAX_SIDE) and webcam without stitching them."""
+    images, labels, scale_factors, backends = capture_all(webcam_scale=1.0, max_side=MAX_SIDE)
 
     if not images:
         raise RuntimeError("No images captured")
 
+    return images, labels, scale_factors, backends
+
+
+def capture_all_stitched() -> bytes:
+    """Capture all monitors and webcam, return as single stitched image."""
+    images, labels, scale_factors, _ = capture_frames()
     return stitch_images(images, labels, scale_factors)
 
 
+def capture_digest(monitor_frames: list[bytes]) -> bytes:
+    """Content digest of a capture's monitor frames, equal only when every screen is byte-identical.
+
+    The webcam is left out on purpose: sensor noise makes every webcam frame unique.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for frame in monitor_frames:
+        digest.update(len(frame).to_bytes(8, "big"))
+        digest.update(frame)
+    return digest.digest()
+
+
+def _verdict_key(images: list[bytes], prompt: str, digests: list[bytes] | None) -> tuple[bytes, bytes]:
+    """Build the verdict cache key for a batch, hashing the images unless digests are given."""
+    if digests is None:
+        digests = [capture_digest([image]) for image in images]
+    return hashlib.sha256(prompt.encode()).digest(), b"".join(digests)
+
+
+def _get_cached_verdict(key: tuple[bytes, bytes]) -> tuple[bool, str, str] | None:
+    """Look up a cached verdict, marking it as recently used."""
+    with _verdict_cache_lock:
+        verdict = _verdict_cache.get(key)
+        if verdict is not None:
+            _verdict_cache.move_to_end(key)
+            log.info("Using cached analysis for identical captures")
+        return verdict
+
+
+def _store_verdict(key: tuple[bytes, bytes], verdict: tuple[bool, str, str]):
+    """Cache a verdict, evicting the least recently used one when full."""
+    with _verdict_cache_lock:
+        _verdict_cache[key] = verdict
+        _verdict_cache.move_to_end(key)
+        if len(_verdict_cache) > VERDICT_CACHE_SIZE:
+            _verdict_cache.popitem(last=False)
+
+
+def _cache_verdicts(func):
+    """Memoize an analyze function by prompt and per-image content digests."""
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(images: list[bytes], prompt: str, digests: list[bytes] | None = None):
+            key = _verdict_key(images, prompt, digests)
+            verdict = _get_cached_verdict(key)
+            if verdict is None:
+                verdict = await func(images, prompt)
+                _store_verdict(key, verdict)
+            return verdict
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(images: list[bytes], prompt: str, digests: list[bytes] | None = None):
+        key = _verdict_key(images, prompt, digests)
+        verdict = _get_cached_verdict(key)
+        if verdict is None:
+            verdict = func(images, prompt)
+            _store_verdict(key, verdict)
+        return verdict
+    return wrapper
+
+
+def _report_analysis(analysis: str) -> tuple[bool, str, str]:
+    """Log the raw analysis and parse it into (is_productive, reason, raw_analysis)."""
+    rule = "=" * 50
+    log.info("\n%s\nPRODUCTIVITY ANALYSIS:\n%s\n%s\n%s", rule, rule, analysis, rule)
+
+    is_productive, reason = parse_productivity_response(analysis)
+    return is_productive, reason, analysis
+
+
+@_cache_verdicts
 def analyze_captures(images: list[bytes], prompt: str) -> tuple[bool, str, str]:
     """
     Send captures to LLM for productivity analysis.
@@ -60,19 +157,24 @@ def analyze_captures(images: list[bytes], prompt: str) -> tuple[bool, str, str]:
     Returns:
         (is_productive, reason, raw_analysis)
     """
-    backend = "local Ollama" if is_local_model(SCREENSHOT_MODEL) else "OpenAI"
-    print(f"Sending to {backend} ({SCREENSHOT_MODEL})...")
+    log.info("Sending to %s (%s)...", _ANALYSIS_BACKEND, SCREENSHOT_MODEL)
 
-    analysis = complete_vision(images, prompt=prompt, model=SCREENSHOT_MODEL)
+    analysis = complete_vision(images, prompt=prompt, model=SCREENSHOT_MODEL, detail=VISION_DETAIL)
+    return _report_analysis(analysis)
 
-    print("\n" + "=" * 50)
-    print("PRODUCTIVITY ANALYSIS:")
-    print("=" * 50)
-    print(analysis)
-    print("=" * 50)
 
-    is_productive, reason = parse_productivity_response(analysis)
-    return is_productive, reason, analysis
+@_cache_verdicts
+async def analyze_captures_async(images: list[bytes], prompt: str) -> tuple[bool, str, str]:
+    """
+    Async version of analyze_captures, so capturing can continue during the LLM call.
+
+    Returns:
+        (is_productive, reason, raw_analysis)
+    """
+    log.info("Sending to %s (%s)...", _ANALYSIS_BACKEND, SCREENSHOT_MODEL)
+
+    analysis = await complete_vision_async(images, prompt=prompt, model=SCREENSHOT_MODEL, detail=VISION_DETAIL)
+    return _report_analysis(analysis)
 
 
 def speak_result(is_productive: bool, reason: str):
@@ -82,14 +184,19 @@ def speak_result(is_productive: bool, reason: str):
     else:
         message = reason
 
-    print(f"\n[TTS] {message}")
+    log.info("\n[TTS] %s", message)
     speak(message)
 
 
-def save_analysis(prompt: str, analysis: str, prefix: str = "productivity_analysis"):
-    """Save prompt and analysis to disk."""
+def save_analysis(
+    prompt: str, analysis: str, screenshot_backend: str = "unknown", prefix: str = "productivity_analysis"
+):
+    """Save prompt and analysis to disk, noting the screenshot backend behind the captures."""
     timestamp = get_timestamp()
-    full_text = f"PROMPT:\n{prompt}\n\n{'='*50}\n\nANALYSIS:\n{analysis}"
+    full_text = (
+        f"Screenshot Backend: {screenshot_backend}\n\n"
+        f"PROMPT:\n{prompt}\n\n{'='*50}\n\nANALYSIS:\n{analysis}"
+    )
     text_path = save_text(full_text, f"{prefix}_{timestamp}")
-    print(f"Analysis saved to {text_path}")
+    log.debug("Analysis saved to %s", text_path)
     return text_path
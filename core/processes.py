@@ -1,51 +1,278 @@
 """Process management for killing distraction applications."""
 
+import ctypes
 import os
-import subprocess
+import signal
+import threading
+import time
+from ctypes import wintypes
 
-from .config import APP_PATHS
+from .config import APP_PATHS, IS_WINDOWS
+from .logs import get_logger
 
+log = get_logger(__name__)
 
-def kill_target_processes():
-    """Find and terminate processes listed in APP_PATHS."""
-    killed_any = False
+# psutil is used where the Toolhelp32 snapshot is unavailable (or fails)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# WMI process-start events let the killer react to launches instead of polling (Windows only)
+try:
+    import pythoncom
+    import wmi
+except ImportError:
+    wmi = None
+
+# Full sweep interval while watching for process starts, to retry kills that failed
+WATCH_SWEEP_SECONDS = 30.0
+
+# Toolhelp32 snapshot walks the process list in one kernel call (Windows only)
+_TH32CS_SNAPPROCESS = 0x00000002
+_PROCESS_TERMINATE = 0x0001
+_ERROR_ACCESS_DENIED = 5
+_INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_void_p),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * 260),
+    ]
+
+
+if IS_WINDOWS:
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _kernel32.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+else:
+    _kernel32 = None
+
+
+def _get_target_executables() -> tuple[str, ...]:
+    """Get the executable names from APP_PATHS, warning about entries without one."""
+    executables = []
     for app_name, app_path in APP_PATHS.items():
         executable_name = os.path.basename(app_path)
         if not executable_name:
-            print(f"Warning: Could not determine executable name for {app_name} from path '{app_path}'. Skipping.")
+            log.warning("Could not determine executable name for %s from path '%s'. Skipping.", app_name, app_path)
             continue
+        executables.append(executable_name)
+    return tuple(executables)
 
-        command = ["taskkill", "/F", "/IM", executable_name, "/T"]
-        try:
-            creationflags = subprocess.CREATE_NO_WINDOW
-            result = subprocess.run(
-                command, check=False, capture_output=True, text=True, creationflags=creationflags
-            )
 
-            if result.returncode == 0:
-                print(f"Successfully sent termination signal to processes matching {executable_name}.")
+# APP_PATHS is fixed at import, so resolve the target names once
+TARGET_EXECUTABLES = _get_target_executables()
+_TARGET_BASENAMES = frozenset(name.lower() for name in TARGET_EXECUTABLES)
+# Also match names reported without the extension (e.g. "discord" for "Discord.exe")
+_TARGET_NAMES_NO_EXT = frozenset(os.path.splitext(name)[0] for name in _TARGET_BASENAMES)
+_TARGET_NAMES = _TARGET_BASENAMES | _TARGET_NAMES_NO_EXT
+
+# (PID, create time) of processes known not to be targets, so their names aren't queried
+# every pass; the create time tells a recycled PID apart from the process it replaced
+_non_target_procs: set[tuple[int, float]] = set()
+# Target PIDs that refused termination (e.g. Discord helpers), reported once instead of every sweep
+_access_denied_pids: set[int] = set()
+
+
+def _log_kill_failure(name: str, pid: int, error: Exception, access_denied: bool):
+    """Log a failed kill, reporting expected access-denied failures only once per PID at debug level."""
+    if not access_denied:
+        log.error("Error attempting to kill %s (PID %d): %s", name, pid, error)
+    elif pid not in _access_denied_pids:
+        _access_denied_pids.add(pid)
+        log.debug("Could not terminate %s (PID %d): %s", name, pid, error)
+
+
+def _kill_with_psutil(executables: frozenset[str]) -> bool:
+    """Kill running processes whose name is in executables (lowercased). Returns True if any were killed."""
+    killed_any = False
+    pids = set(psutil.pids())
+    _access_denied_pids.intersection_update(pids)
+    seen = set()
+
+    for pid in pids:
+        try:
+            # Process() already reads the create time to identify the process
+            proc = psutil.Process(pid)
+            key = (pid, proc.create_time())
+            seen.add(key)
+            if key in _non_target_procs:
+                continue
+            name = proc.name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        if not name or name.lower() not in executables:
+            _non_target_procs.add(key)
+            continue
+        try:
+            # Children first, like taskkill /T, so helpers can't respawn the UI
+            family = [*proc.children(recursive=True), proc]
+        except psutil.NoSuchProcess:
+            continue
+        except psutil.AccessDenied:
+            family = [proc]
+        for member in family:
+            member_name = name if member is proc else f"child of {name}"
+            try:
+                member.kill()
+                log.info("Successfully terminated %s (PID %d).", member_name, member.pid)
                 killed_any = True
-            elif result.returncode == 128 and "not found" in result.stderr.lower():
-                pass
-            else:
-                is_discord_termination_error = (
-                    executable_name.lower() == "discord.exe" and
-                    result.returncode != 0 and
-                    ("could not be terminated" in result.stderr.lower() or
-                     "could not be terminated" in result.stdout.lower())
-                )
-
-                if not is_discord_termination_error:
-                    print(f"Error attempting to kill {executable_name}:")
-                    print(f"  Return Code: {result.returncode}")
-                    if result.stdout:
-                        print(f"  Stdout: {result.stdout.strip()}")
-                    if result.stderr:
-                        print(f"  Stderr: {result.stderr.strip()}")
-
-        except FileNotFoundError:
-            print(f"Error: 'taskkill' command not found. Is it in your system's PATH?")
-        except Exception as e:
-            print(f"An unexpected error occurred while trying to kill {executable_name}: {e}")
+            except psutil.NoSuchProcess:
+                continue
+            except psutil.AccessDenied as e:
+                _log_kill_failure(member_name, member.pid, e, access_denied=True)
+
+    # Forget processes that have exited
+    _non_target_procs.intersection_update(seen)
+    return killed_any
 
+
+def _terminate_pid(pid: int, name: str) -> bool:
+    """Terminate one process via TerminateProcess. Returns True if it was killed."""
+    handle = _kernel32.OpenProcess(_PROCESS_TERMINATE, False, pid)
+    if handle and _kernel32.TerminateProcess(handle, 1):
+        log.info("Successfully terminated %s (PID %d).", name, pid)
+        killed = True
+    else:
+        error = ctypes.get_last_error()
+        _log_kill_failure(name, pid, ctypes.WinError(error), error == _ERROR_ACCESS_DENIED)
+        killed = False
+    if handle:
+        _kernel32.CloseHandle(handle)
+    return killed
+
+
+def _kill_with_toolhelp(executables: frozenset[str]) -> bool:
+    """Kill matching processes and their descendants from one Toolhelp32 snapshot. Returns True if any were killed."""
+    snapshot = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    names: dict[int, str] = {}
+    children: dict[int, list[int]] = {}
+    entry = _PROCESSENTRY32W()
+    entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+    try:
+        has_entry = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while has_entry:
+            names[entry.th32ProcessID] = entry.szExeFile
+            children.setdefault(entry.th32ParentProcessID, []).append(entry.th32ProcessID)
+            has_entry = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+    # Like taskkill /T: also take down child processes (helpers, updaters) that would respawn the UI
+    targets = [pid for pid, name in names.items() if name.lower() in executables]
+    doomed = dict.fromkeys(targets)
+    for pid in targets:
+        stack = list(children.get(pid, ()))
+        while stack:
+            child = stack.pop()
+            if child not in doomed and child != pid:
+                doomed[child] = None
+                stack.extend(children.get(child, ()))
+
+    killed_any = False
+    for pid in doomed:
+        killed_any |= _terminate_pid(pid, names[pid])
+    # Forget PIDs that are gone so a reused PID is reported again
+    _access_denied_pids.intersection_update(doomed)
     return killed_any
+
+
+def kill_target_processes():
+    """Find and terminate processes listed in APP_PATHS."""
+    if not TARGET_EXECUTABLES:
+        return False
+
+    if _kernel32 is not None:
+        try:
+            return _kill_with_toolhelp(_TARGET_BASENAMES)
+        except OSError as e:
+            log.warning("Process snapshot failed: %s", e)
+    if psutil is not None:
+        return _kill_with_psutil(_TARGET_NAMES)
+    return False
+
+
+def _kill_pid(pid: int, name: str) -> bool:
+    """Kill a single process by PID. Returns True if it was killed."""
+    if psutil is not None:
+        try:
+            psutil.Process(pid).kill()
+        except psutil.Error as e:
+            _log_kill_failure(name, pid, e, isinstance(e, psutil.AccessDenied))
+            return False
+    else:
+        try:
+            os.kill(pid, signal.SIGTERM)  # TerminateProcess on Windows
+        except OSError as e:
+            _log_kill_failure(name, pid, e, isinstance(e, PermissionError))
+            return False
+    log.info("Successfully terminated %s (PID %d).", name, pid)
+    return True
+
+
+def watch_and_kill(stop_event: threading.Event) -> bool:
+    """
+    Kill target processes as they start, driven by WMI process-start events.
+
+    Blocks until stop_event is set. A full sweep also runs every
+    WATCH_SWEEP_SECONDS to catch anything a failed kill left running.
+
+    Args:
+        stop_event: Event that ends the watch when set
+
+    Returns:
+        True after watching until stopped, or False if WMI events are
+        unavailable or fail (the caller should poll instead)
+    """
+    if wmi is None or not TARGET_EXECUTABLES:
+        return False
+
+    pythoncom.CoInitialize()
+    try:
+        try:
+            watcher = wmi.WMI().Win32_ProcessStartTrace.watch_for()
+        except Exception as e:
+            log.warning("WMI process watcher unavailable, polling instead: %s", e)
+            return False
+
+        next_sweep = time.monotonic() + WATCH_SWEEP_SECONDS
+        while not stop_event.is_set():
+            try:
+                event = watcher(timeout_ms=1000)
+            except wmi.x_wmi_timed_out:
+                event = None
+            except Exception as e:
+                # e.g. the WMI service restarted or RPC went away; let the caller poll instead
+                log.warning("WMI process watcher failed, polling instead: %s", e)
+                return False
+
+            if event is not None:
+                name = event.ProcessName or ""
+                if name.lower() in _TARGET_NAMES:
+                    _kill_pid(event.ProcessID, name)
+
+            if time.monotonic() >= next_sweep:
+                kill_target_processes()
+                next_sweep = time.monotonic() + WATCH_SWEEP_SECONDS
+        return True
+    finally:
+        pythoncom.CoUninitialize()
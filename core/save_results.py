@@ -20,6 +20,13 @@ def get_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+def get_image_extension(image_bytes: bytes) -> str:
+    """Get the file extension matching encoded image bytes (.png or .jpg)."""
+    if image_bytes.startswith(b"\x89PNG"):
+        return ".png"
+    return ".jpg"
+
+
 def ensure_directory(path: str | Path) -> Path:
     """Create directory if it doesn't exist."""
     path = Path(path)
@@ -63,7 +70,7 @@ def save_image(
     image_bytes: bytes,
     filename: str | None = None,
     directory: str | Path = DEFAULT_IMAGE_DIR,
-    extension: str = ".png"
+    extension: str | None = None
 ) -> Path:
     """
     Save image bytes to a file.
@@ -72,12 +79,13 @@ def save_image(
         image_bytes: Image data as bytes
         filename: Optional filename (without extension). If None, uses timestamp
         directory: Directory to save to
-        extension: File extension (default: .png)
+        extension: File extension (default: detected from image bytes)
 
     Returns:
         Path to saved file
     """
     directory = ensure_directory(directory)
+    extension = extension or get_image_extension(image_bytes)
 
     if filename is None:
         filename = f"screenshot_{get_timestamp()}"
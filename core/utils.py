@@ -3,11 +3,19 @@
 import sys
 import os
 import ctypes
+import functools
 import subprocess
+import threading
 
+from .config import IS_WINDOWS
+from .logs import get_logger
 
+log = get_logger(__name__)
+
+
+@functools.cache
 def is_admin():
-    """Check if the script is running with administrative privileges."""
+    """Check if the script is running with administrative privileges (fixed for the process lifetime)."""
     try:
         return ctypes.windll.shell32.IsUserAnAdmin()
     except:
@@ -16,7 +24,7 @@ def is_admin():
 
 def run_as_admin():
     """Re-run the script with administrative privileges."""
-    if sys.platform == 'win32':
+    if IS_WINDOWS:
         script = os.path.abspath(sys.argv[0])
         params = ' '.join([script] + sys.argv[1:])
         try:
@@ -30,25 +38,59 @@ def run_as_admin():
         sys.exit(1)
 
 
-def flush_dns():
-    """Flush the DNS cache."""
+def _load_dns_flush():
+    """Resolve dnsapi.dll's DnsFlushResolverCache once, or None if it is unavailable."""
+    if not IS_WINDOWS:
+        return None
+    try:
+        func = ctypes.WinDLL("dnsapi", use_last_error=True).DnsFlushResolverCache
+    except (AttributeError, OSError):
+        return None
+    func.argtypes = []
+    func.restype = ctypes.c_int  # BOOL
+    return func
+
+
+_DnsFlushResolverCache = _load_dns_flush()
+
+
+def _flush_dns_ipconfig():
+    """Flush the DNS cache by running ipconfig /flushdns."""
     try:
-        print("Flushing DNS cache...")
         subprocess.run(["ipconfig", "/flushdns"], check=True, capture_output=True, text=True)
-        print("DNS cache flushed successfully.")
+        log.info("DNS cache flushed successfully.")
     except FileNotFoundError:
-        print("Error: 'ipconfig' command not found. Is it in your system's PATH?")
+        log.error("'ipconfig' command not found. Is it in your system's PATH?")
     except subprocess.CalledProcessError as e:
-        print(f"Error flushing DNS cache: {e}")
-        print(f"Stderr: {e.stderr}")
+        log.error("Error flushing DNS cache: %s", e)
+        log.error("Stderr: %s", e.stderr)
     except Exception as e:
-        print(f"An unexpected error occurred during DNS flush: {e}")
+        log.error("An unexpected error occurred during DNS flush: %s", e)
+
+
+def flush_dns():
+    """Flush the DNS cache."""
+    log.info("Flushing DNS cache...")
+    if _DnsFlushResolverCache is not None:
+        if _DnsFlushResolverCache():
+            log.info("DNS cache flushed successfully.")
+        else:
+            log.error("Error flushing DNS cache: %s", ctypes.WinError(ctypes.get_last_error()))
+        return
+
+    # Only reached when dnsapi.dll cannot be loaded; ipconfig is slow to spawn, so run
+    # it in the background instead of holding up the mode switch
+    threading.Thread(target=_flush_dns_ipconfig, daemon=True, name="flush-dns").start()
+
 
+def prompt_confirmation(phrase, action_name, read_line=input):
+    """Prompt user to type a confirmation phrase. Returns True if confirmed, False otherwise.
 
-def prompt_confirmation(phrase, action_name):
-    """Prompt user to type a confirmation phrase. Returns True if confirmed, False otherwise."""
+    read_line is called like input() and may raise EOFError; pass a custom reader
+    when stdin is consumed elsewhere (e.g. by a background reader thread).
+    """
     try:
-        confirm_input = input(f"Please type the following phrase exactly to confirm: '{phrase}'\nEnter phrase: ")
+        confirm_input = read_line(f"Please type the following phrase exactly to confirm: '{phrase}'\nEnter phrase: ")
     except EOFError:
         print(f"\nEOF received during confirmation, cancelling {action_name}.")
         return False
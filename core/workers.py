@@ -1,50 +1,147 @@
 """Thread workers for deep work monitoring."""
 
+import asyncio
+import atexit
+import json
+import math
+import queue
 import threading
 import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable
 
-from .config import CAPTURE_INTERVAL_SECONDS, CAPTURES_BEFORE_ANALYSIS, POSITIVE_TTS_EVERY_N
-from .processes import kill_target_processes
-from .monitoring import capture_all_stitched, analyze_captures, speak_result, save_analysis
+from .config import (
+    CAPTURE_INTERVAL_SECONDS,
+    CAPTURES_BEFORE_ANALYSIS,
+    KILLER_MAX_POLL_SECONDS,
+    KILLER_MIN_POLL_SECONDS,
+    POSITIVE_TTS_EVERY_N,
+    SKIP_STATIC_SCREENS,
+)
+from .processes import kill_target_processes, watch_and_kill
+from .monitoring import (
+    capture_frames,
+    analyze_captures_async,
+    speak_result,
+    save_analysis,
+    capture_digest,
+)
+from .capture_describer import release_webcams, stitch_images
 from .save_results import save_image, get_timestamp
+from .logs import get_logger
+
+log = get_logger(__name__)
+
+# Verdict reported for a batch whose captures are all the same, matching the prompt's red flag
+_STATIC_SCREEN_REASON = "Hey, I noticed your screen looks identical in all captures - are you still there?"
+_STATIC_SCREEN_VERDICT = (
+    False,
+    _STATIC_SCREEN_REASON,
+    json.dumps({"productive": "no", "reason": _STATIC_SCREEN_REASON}),
+)
+
+
+def _put_latest(q: queue.Queue, item):
+    """Put an item on a bounded queue, dropping the stale entry if it is full."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                dropped = q.get_nowait()
+            except queue.Empty:
+                continue
+            if dropped is not None:
+                log.warning("Encoder busy, dropping stale capture")
+
+
+# Shared background event loop for async LLM calls
+_event_loop: asyncio.AbstractEventLoop | None = None
+_event_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting its thread on first use."""
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(target=_event_loop.run_forever, daemon=True, name="llm-event-loop").start()
+        return _event_loop
 
 
 class ManagedThread:
     """Base class for threads with clean start/stop lifecycle."""
 
+    # Live instances, so every worker can be stopped at interpreter exit
+    _instances: "weakref.WeakSet[ManagedThread]" = weakref.WeakSet()
+
     def __init__(self, name: str):
         self.name = name
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
-        self._lock = threading.Lock()
+        # Guards swapping _thread and clearing/setting _stop_event in start() and stop()
+        self._start_lock = threading.Lock()
+        # Set by stop() before it waits for the lock, so a stop requested mid-start wins
+        self._stopped = False
+        ManagedThread._instances.add(self)
 
-    def start(self):
+    def start(self, timeout: float = 5.0):
         """Start the thread if not already running."""
-        with self._lock:
-            if self._thread is not None and self._thread.is_alive():
+        self._stopped = False
+        with self._start_lock:
+            thread = self._thread
+            if thread is not None and thread.is_alive():
+                if not self._stop_event.is_set():
+                    return
+                # A previous run is still winding down; never run two copies at once
+                thread.join(timeout=timeout)
+                if thread.is_alive():
+                    log.warning("%s is still stopping, not starting it again.", self.name)
+                    return
+            if self._stopped:
                 return
             self._stop_event.clear()
-            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
             self._thread.start()
-            print(f"{self.name} started.")
-
-    def stop(self, timeout: float = 5.0):
-        """Stop the thread and wait for it to finish."""
-        with self._lock:
-            if self._thread is None or not self._thread.is_alive():
-                return
+            log.info("%s started.", self.name)
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """Stop the thread and wait for it to finish. Returns False if it is still running."""
+        self._stopped = True
+        # Under the lock so a concurrent start() can't swap the thread or clear the event
+        # between this check and set(); the join happens outside it
+        with self._start_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return True
             self._stop_event.set()
-        self._thread.join(timeout=timeout)
-        with self._lock:
-            self._thread = None
-        print(f"{self.name} stopped.")
+        if thread is threading.current_thread():
+            # Stopping from inside _run: it exits once control returns to its loop
+            return False
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            log.warning("%s did not stop within %ss.", self.name, timeout)
+            return False
+        log.info("%s stopped.", self.name)
+        return True
+
+    @classmethod
+    def stop_all(cls, timeout: float = 1.0):
+        """Stop every live worker (registered to run at interpreter exit)."""
+        for worker in list(cls._instances):
+            worker.stop(timeout=timeout)
 
     def _run(self):
         """Override in subclass."""
         raise NotImplementedError
 
 
+atexit.register(ManagedThread.stop_all)
+
+
 class ProcessKillerThread(ManagedThread):
     """Continuously kills distracting processes."""
 
@@ -52,9 +149,18 @@ class ProcessKillerThread(ManagedThread):
         super().__init__("Process killer")
 
     def _run(self):
-        while not self._stop_event.is_set():
-            kill_target_processes()
-            self._stop_event.wait(timeout=1.0)
+        # Kill anything already running, then react to launches if WMI events work
+        kill_target_processes()
+        if watch_and_kill(self._stop_event):
+            return
+
+        # Poll quickly right after a kill (apps often relaunch themselves), back off while idle
+        interval = KILLER_MIN_POLL_SECONDS
+        while not self._stop_event.wait(timeout=interval):
+            if kill_target_processes():
+                interval = KILLER_MIN_POLL_SECONDS
+            else:
+                interval = min(interval * 1.5, KILLER_MAX_POLL_SECONDS)
 
 
 class ProductivityMonitorThread(ManagedThread):
@@ -65,87 +171,244 @@ class ProductivityMonitorThread(ManagedThread):
         self.prompt = prompt
         self.on_analysis = on_analysis
         self._positive_count = 0
+        self._result_lock = threading.Lock()
+        # Monitor-frame digests and verdict of the last batch the LLM actually analyzed
+        self._last_digests: list[bytes] = []
+        self._last_verdict: tuple[bool, str, str] | None = None
+        # At most one analysis in flight; a batch that arrives meanwhile is dropped
+        self._analysis_slot = threading.Semaphore(1)
+        # Single writer so captures and analyses hit the disk in order, off the capture path
+        self._io_pool: ThreadPoolExecutor | None = None
 
     def _run(self):
-        # Initial delay before first capture
-        print(f"Starting capture in {CAPTURE_INTERVAL_SECONDS}s...")
-        for _ in range(int(CAPTURE_INTERVAL_SECONDS * 10)):
-            if self._stop_event.is_set():
-                return
-            time.sleep(0.1)
+        try:
+            self._monitor_loop()
+        finally:
+            # Turn the camera off while monitoring is paused
+            release_webcams()
 
-        captured_images = []
+    def _monitor_loop(self):
+        # Initial delay before first capture
+        log.info("Starting capture in %ss...", CAPTURE_INTERVAL_SECONDS)
+        if self._stop_event.wait(timeout=CAPTURE_INTERVAL_SECONDS):
+            return
+
+        # Capture -> encode -> describe pipeline: this thread only grabs frames,
+        # the encoder stitches/saves/batches them and the event loop describes
+        frames: queue.Queue = queue.Queue(maxsize=1)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deepwork-io")
+        encoder = threading.Thread(
+            target=self._encode_loop, args=(frames,), daemon=True, name="monitor-encoder"
+        )
+        encoder.start()
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    timestamp = get_timestamp()
+                    log.info("\n[%s] Capturing...", timestamp)
+
+                    _put_latest(frames, (timestamp, *capture_frames()))
+
+                    # Wait for next capture, waking immediately on stop
+                    if self._stop_event.wait(timeout=CAPTURE_INTERVAL_SECONDS):
+                        return
 
-        while not self._stop_event.is_set():
+                except Exception as e:
+                    log.error("Monitor error: %s", e)
+                    self._stop_event.wait(timeout=CAPTURE_INTERVAL_SECONDS)
+        finally:
+            _put_latest(frames, None)
+            encoder.join()
+            # Flush pending writes before monitoring counts as stopped
+            self._io_pool.shutdown(wait=True)
+
+    def _submit_io(self, fn: Callable, *args):
+        """Run a blocking job (disk write, result report) on the IO thread, or inline once the pool has shut down."""
+        try:
+            future = self._io_pool.submit(fn, *args)
+        except (AttributeError, RuntimeError):
+            # No pool yet or already shut down (late analysis result)
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+        future.add_done_callback(self._on_io_done)
+
+    @staticmethod
+    def _on_io_done(future: Future):
+        """Log where a background write landed, or why a background job failed."""
+        if future.exception() is not None:
+            log.error("Background IO failed: %s", future.exception())
+        elif future.result() is not None:
+            log.debug("Saved to %s", future.result())
+
+    def _encode_loop(self, frames: queue.Queue):
+        """Stitch captured frames, queue them for saving and dispatch full batches for analysis."""
+        # Fixed batch slots reused every cycle; the digest is computed as each capture arrives
+        captured_images: list[bytes] = [b""] * CAPTURES_BEFORE_ANALYSIS
+        # Monitor-frame digests, so captures of an unchanged screen are neither saved nor uploaded twice
+        captured_digests: list[bytes] = [b""] * CAPTURES_BEFORE_ANALYSIS
+        # Screenshot backends behind the current batch, recorded with its analysis
+        batch_backends: set[str] = set()
+        last_digest = b""
+        count = 0
+
+        while (frame := frames.get()) is not None:
+            timestamp, images, labels, scale_factors, backends = frame
             try:
-                timestamp = get_timestamp()
-                print(f"\n[{timestamp}] Capturing...")
-
-                stitched_image = capture_all_stitched()
-                captured_images.append(stitched_image)
-
-                image_path = save_image(stitched_image, f"productivity_{timestamp}")
-                print(f"Saved to {image_path}")
-                print(f"Captured {len(captured_images)}/{CAPTURES_BEFORE_ANALYSIS}")
-
-                if len(captured_images) >= CAPTURES_BEFORE_ANALYSIS:
-                    print(f"\nAnalyzing {len(captured_images)} captures...")
-
-                    is_productive, reason, analysis = analyze_captures(
-                        captured_images, self.prompt
-                    )
-                    self.on_analysis(analysis, is_productive)
-
-                    if is_productive:
-                        self._positive_count += 1
-                        if self._positive_count >= POSITIVE_TTS_EVERY_N:
-                            speak_result(is_productive, reason)
-                            self._positive_count = 0
-                        else:
-                            print(f"[TTS] Skipping positive feedback ({self._positive_count}/{POSITIVE_TTS_EVERY_N})")
+                stitched_image = stitch_images(images, labels, scale_factors)
+                digest = capture_digest([image for image, label in zip(images, labels) if label != "Webcam"])
+                captured_images[count] = stitched_image
+                captured_digests[count] = digest
+                batch_backends.update(backend for backend in backends if backend != "webcam")
+                count += 1
+
+                if digest == last_digest:
+                    log.debug("Screen identical to the previous capture, not saving it again")
+                else:
+                    self._submit_io(save_image, stitched_image, f"productivity_{timestamp}")
+                last_digest = digest
+                log.info("Captured %d/%d", count, CAPTURES_BEFORE_ANALYSIS)
+
+                if count >= CAPTURES_BEFORE_ANALYSIS:
+                    # Reset before handing off so a failure below can never grow the batch,
+                    # and drop the slot references so finished batches can be freed
+                    count = 0
+                    batch, digests = captured_images.copy(), captured_digests.copy()
+                    captured_images[:] = [b""] * CAPTURES_BEFORE_ANALYSIS
+                    screenshot_backend = ", ".join(sorted(batch_backends)) or "none"
+                    batch_backends.clear()
+
+                    # Verdicts reached without the LLM are still reported off this thread,
+                    # since TTS would otherwise stall the capture pipeline
+                    if self._is_static(digests):
+                        log.info("\nScreen static across the whole batch, skipping analysis")
+                        self._submit_io(self._handle_result, *_STATIC_SCREEN_VERDICT, screenshot_backend)
+                    elif self._is_unchanged(digests):
+                        log.info("\nScreen unchanged since last analysis, reusing verdict")
+                        self._submit_io(self._handle_result, *self._last_verdict, screenshot_backend)
+                    elif not self._analysis_slot.acquire(blocking=False):
+                        log.warning("\nPrevious analysis still running, dropping this batch")
                     else:
-                        self._positive_count = 0
-                        speak_result(is_productive, reason)
-
-                    save_analysis(self.prompt, analysis)
+                        images, prompt = self._drop_repeats(batch, digests)
+                        log.info("\nAnalyzing %d captures...", len(images))
 
-                    captured_images = []
-
-                # Wait for next capture, checking stop event frequently
-                for _ in range(int(CAPTURE_INTERVAL_SECONDS * 10)):
-                    if self._stop_event.is_set():
-                        return
-                    time.sleep(0.1)
+                        # Analyze in the background so capturing keeps its cadence
+                        future = asyncio.run_coroutine_threadsafe(
+                            self._analyze(images, prompt, digests, screenshot_backend), get_event_loop()
+                        )
+                        future.add_done_callback(self._on_analysis_done)
 
             except Exception as e:
-                print(f"Monitor error: {e}")
-                time.sleep(CAPTURE_INTERVAL_SECONDS)
+                log.error("Monitor error: %s", e)
+
+    def _drop_repeats(self, images: list[bytes], digests: list[bytes]) -> tuple[list[bytes], str]:
+        """Leave out captures whose screens match the capture before them, telling the model so in the prompt."""
+        unique = [image for i, image in enumerate(images) if i == 0 or digests[i] != digests[i - 1]]
+        if len(unique) == len(images):
+            return images, self.prompt
+        note = (
+            f"\n\nNote: {len(images) - len(unique)} of the {len(images)} captures showed exactly the same "
+            f"screen as the capture before them and are left out, so the screen did not change between those captures."
+        )
+        return unique, self.prompt + note
+
+    @staticmethod
+    def _is_static(digests: list[bytes]) -> bool:
+        """Check whether every capture in a batch shows exactly the same screens (the webcam is ignored)."""
+        return SKIP_STATIC_SCREENS and len(digests) > 1 and digests.count(digests[0]) == len(digests)
+
+    def _is_unchanged(self, digests: list[bytes]) -> bool:
+        """Check whether a batch's screens are byte-identical to the last analyzed batch."""
+        return self._last_verdict is not None and digests == self._last_digests
+
+    async def _analyze(self, images: list[bytes], prompt: str, digests: list[bytes], screenshot_backend: str):
+        """Run the LLM analysis, then handle the result off the event loop."""
+        is_productive, reason, analysis = await analyze_captures_async(images, prompt, digests)
+        self._last_digests = digests
+        self._last_verdict = (is_productive, reason, analysis)
+        # TTS and disk writes block, so keep them off the event loop
+        await asyncio.to_thread(self._handle_result, is_productive, reason, analysis, screenshot_backend)
+
+    def _handle_result(self, is_productive: bool, reason: str, analysis: str, screenshot_backend: str):
+        """Report an analysis result via callback, TTS and disk."""
+        if self._stop_event.is_set():
+            # Monitoring was stopped while the analysis was in flight
+            return
+
+        with self._result_lock:
+            self.on_analysis(analysis, is_productive)
+
+            if is_productive:
+                self._positive_count += 1
+                if self._positive_count >= POSITIVE_TTS_EVERY_N:
+                    speak_result(is_productive, reason)
+                    self._positive_count = 0
+                else:
+                    log.debug("[TTS] Skipping positive feedback (%d/%d)", self._positive_count, POSITIVE_TTS_EVERY_N)
+            else:
+                self._positive_count = 0
+                speak_result(is_productive, reason)
+
+            self._submit_io(save_analysis, self.prompt, analysis, screenshot_backend)
+
+    def _on_analysis_done(self, future: Future):
+        """Free the analysis slot and log errors from a background analysis."""
+        self._analysis_slot.release()
+        if not future.cancelled() and future.exception() is not None:
+            log.error("Monitor error: %s", future.exception())
 
 
 class BreakTimer(ManagedThread):
     """Countdown timer that calls a callback when break ends."""
 
-    def __init__(self, minutes: float, on_tick: Callable[[int], None], on_complete: Callable[[], None]):
+    def __init__(
+        self,
+        minutes: float,
+        on_complete: Callable[[], None],
+        on_tick: Callable[[int], None] | None = None,
+    ):
         super().__init__("Break timer")
         self.minutes = minutes
         self.on_tick = on_tick
         self.on_complete = on_complete
+        self._deadline: float | None = None
 
-    def _run(self):
-        total_seconds = int(self.minutes * 60)
-        print(f"Break timer: {self.minutes} minute(s)")
+    @property
+    def remaining(self) -> int:
+        """Whole seconds left in the break (0 when not running)."""
+        if self._deadline is None or self._stop_event.is_set():
+            return 0
+        return max(0, math.ceil(self._deadline - time.monotonic()))
 
-        for remaining in range(total_seconds, 0, -1):
+    def _tick(self, remaining: int):
+        if self.on_tick is not None:
             self.on_tick(remaining)
-            if self._stop_event.is_set():
-                self.on_tick(0)
+
+    def _run(self):
+        total_seconds = int(self.minutes * 60)
+        self._deadline = time.monotonic() + total_seconds
+        log.info("Break timer: %s minute(s)", self.minutes)
+
+        # Only wake up for the announced ticks: whole minutes, 30s and the last 10s
+        announced = {*range(60, total_seconds + 1, 60), 30, *range(1, 11)}
+        schedule = [
+            (remaining, "%02d:%02d" % divmod(remaining, 60))
+            for remaining in sorted((r for r in announced if r <= total_seconds), reverse=True)
+        ]
+        for remaining, label in schedule:
+            if self._stop_event.wait(timeout=max(0.0, self._deadline - remaining - time.monotonic())):
+                self._tick(0)
                 return
-            if remaining % 60 == 0 or remaining == 30 or remaining <= 10:
-                mins, secs = divmod(remaining, 60)
-                print(f"Break remaining: {mins:02d}:{secs:02d}")
-            time.sleep(1)
-
-        self.on_tick(0)
-        if not self._stop_event.is_set():
-            print("\n*** BREAK OVER - Re-enabling blocks and monitoring ***")
-            self.on_complete()
+            self._tick(remaining)
+            log.info("Break remaining: %s", label)
+
+        if self._stop_event.wait(timeout=max(0.0, self._deadline - time.monotonic())):
+            self._tick(0)
+            return
+
+        self._tick(0)
+        log.info("\n*** BREAK OVER - Re-enabling blocks and monitoring ***")
+        self.on_complete()
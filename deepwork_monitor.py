@@ -2,24 +2,131 @@
 """CLI interface for Deep Work with Productivity Monitoring."""
 
 import os
+import queue
+import re
 import sys
-import platform
+import threading
+from typing import TYPE_CHECKING
 
 from core import (
     CONFIRMATION_PHRASE,
-    SCREENSHOT_MODEL,
+    IS_WINDOWS,
     CAPTURE_INTERVAL_SECONDS,
     CAPTURES_BEFORE_ANALYSIS,
     is_admin,
     run_as_admin,
     prompt_confirmation,
-    is_local_model,
-    DeepWorkWithMonitoring,
 )
 
+if TYPE_CHECKING:
+    from core import DeepWorkWithMonitoring
+
+# "break <minutes>", e.g. "break 5", "break 2.5" or "break .5" (but not "breakfast")
+_BREAK_RE = re.compile(r"^break\s+(\d*\.?\d+)$")
+
+# Command prompt for each mode, built once instead of on every read
+_MODE_PROMPTS = {mode: f"[{mode}] > " for mode in ("on", "off", "break")}
+
+
+def start_stdin_reader() -> queue.Queue:
+    """Read stdin lines on a daemon thread so the main loop isn't stuck in input()."""
+    lines: queue.Queue = queue.Queue()
+
+    def reader():
+        for line in sys.stdin:
+            lines.put(line.rstrip("\n"))
+        lines.put(None)  # EOF
+
+    threading.Thread(target=reader, daemon=True, name="stdin-reader").start()
+    return lines
+
+
+def read_line(lines: queue.Queue, prompt: str) -> str:
+    """input() replacement that reads from the stdin reader queue."""
+    print(prompt, end="", flush=True)
+    while True:
+        try:
+            # Timed get, since an untimed one can't be interrupted by Ctrl+C on Windows
+            line = lines.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        if line is None:
+            raise EOFError
+        return line
+
+
+def wait_for_command(lines: queue.Queue, state: "DeepWorkWithMonitoring") -> str:
+    """Prompt for a command, refreshing the prompt if the mode changes meanwhile (e.g. a break ends)."""
+    mode = state.current_mode
+    print(_MODE_PROMPTS[mode], end="", flush=True)
+    while True:
+        try:
+            line = lines.get(timeout=0.5)
+        except queue.Empty:
+            if state.current_mode != mode:
+                mode = state.current_mode
+                print("\n" + _MODE_PROMPTS[mode], end="", flush=True)
+            continue
+        if line is None:
+            raise EOFError
+        return line
+
+
+def handle_on(state: "DeepWorkWithMonitoring", lines: queue.Queue) -> bool:
+    """Turn blocking and monitoring on."""
+    if state.current_mode == "on":
+        print("Already in 'on' mode.")
+        return True
+    state.set_on()
+    print("--- Block mode + monitoring activated ---")
+    return True
+
+
+def handle_off(state: "DeepWorkWithMonitoring", lines: queue.Queue) -> bool:
+    """Turn blocking and monitoring off after confirmation."""
+    if state.current_mode == "off":
+        print("Already in 'off' mode.")
+        return True
+    if prompt_confirmation(CONFIRMATION_PHRASE, "'off' switch", lambda p: read_line(lines, p)):
+        state.set_off()
+        print("--- Unblock mode activated (monitoring stopped) ---")
+    return True
+
+
+def handle_exit(state: "DeepWorkWithMonitoring", lines: queue.Queue) -> bool:
+    """Stop everything and leave the REPL."""
+    print("Exiting...")
+    state.cleanup()
+    return False
+
+
+def handle_break(state: "DeepWorkWithMonitoring", lines: queue.Queue, command: str) -> bool:
+    """Start a break of "break <minutes>" after confirmation."""
+    match = _BREAK_RE.match(command)
+    if not match:
+        print("Usage: break <minutes>")
+        return True
+    minutes = float(match.group(1))
+    if minutes <= 0:
+        print("Duration must be positive.")
+        return True
+
+    if prompt_confirmation(CONFIRMATION_PHRASE, "break", lambda p: read_line(lines, p)):
+        state.set_break(minutes)
+        print(f"--- Break mode: {minutes} min (monitoring paused) ---")
+    return True
+
+
+# Commands without arguments; each handler returns False to leave the REPL
+COMMANDS = {
+    "on": handle_on,
+    "off": handle_off,
+    "exit": handle_exit,
+}
+
 
 def main():
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
         print("Error: This script is designed for Windows only.")
         sys.exit(1)
 
@@ -27,14 +134,22 @@ def main():
         print("Administrator privileges required. Requesting elevation...")
         run_as_admin()
 
+    # Capture, monitoring and LLM modules are slow to import, so load them only once we can run
+    from core import SCREENSHOT_MODEL, is_local_model, DeepWorkWithMonitoring
+
     if not is_local_model(SCREENSHOT_MODEL) and not os.environ.get("OPENAI_API_KEY"):
         print("Error: OPENAI_API_KEY environment variable not set.")
         print("Set it with: export OPENAI_API_KEY='your-api-key'")
         print("Or use local model: set SCREENSHOT_MODEL=gemma3:4b")
         sys.exit(1)
 
+    lines = start_stdin_reader()
+
     print("What do you want to be doing? (e.g., 'learn quantum physics', 'learn AI')")
-    task = input("> ").strip() or "coding or learning"
+    try:
+        task = read_line(lines, "> ").strip() or "coding or learning"
+    except EOFError:
+        task = "coding or learning"
 
     state = DeepWorkWithMonitoring(task)
 
@@ -51,51 +166,16 @@ def main():
     try:
         while True:
             try:
-                user_input = input(f"[{state.current_mode}] > ").strip().lower()
+                user_input = wait_for_command(lines, state).strip().lower()
             except EOFError:
                 user_input = "exit"
 
-            if user_input == "on":
-                if state.current_mode == "on":
-                    print("Already in 'on' mode.")
-                    continue
-                state.set_on()
-                print("--- Block mode + monitoring activated ---")
-
-            elif user_input == "off":
-                if state.current_mode == "off":
-                    print("Already in 'off' mode.")
-                    continue
-                if not prompt_confirmation(CONFIRMATION_PHRASE, "'off' switch"):
-                    continue
-                state.set_off()
-                print("--- Unblock mode activated (monitoring stopped) ---")
-
-            elif user_input.startswith("break"):
-                parts = user_input.split()
-                if len(parts) != 2:
-                    print("Usage: break <minutes>")
-                    continue
-                try:
-                    minutes = float(parts[1])
-                    if minutes <= 0:
-                        print("Duration must be positive.")
-                        continue
-                except ValueError:
-                    print(f"Invalid duration: {parts[1]}")
-                    continue
-
-                if not prompt_confirmation(CONFIRMATION_PHRASE, "break"):
-                    continue
-
-                state.set_break(minutes)
-                print(f"--- Break mode: {minutes} min (monitoring paused) ---")
-
-            elif user_input == "exit":
-                print("Exiting...")
-                state.cleanup()
-                break
-
+            if handler := COMMANDS.get(user_input):
+                if not handler(state, lines):
+                    break
+            elif user_input.partition(" ")[0] == "break":
+                # Takes an argument, so it is parsed separately
+                handle_break(state, lines, user_input)
             elif user_input:
                 print("Commands: on | off | break <min> | exit")
 